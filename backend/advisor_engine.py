@@ -1,39 +1,46 @@
-import json
+import logging
 import os
+import orjson
+from functools import lru_cache
 from models import Profile, AdviceItem, StrategyCard, BeginnerCard
 from typing import Optional, Tuple, List
 
+logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
 def load_combat_progression():
-    """Load combat progression knowledge pack"""
+    """Load combat progression knowledge pack (parsed once; callers must not mutate the result)"""
     knowledge_path = os.path.join(os.path.dirname(__file__), "knowledge", "combat_progression.json")
     try:
-        with open(knowledge_path, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[ADVISOR WARNING] Failed to load combat progression: {e}")
+        with open(knowledge_path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
+        logger.warning("Failed to load combat progression: %s", e)
         return {"combat_brackets": []}
 
 
+@lru_cache(maxsize=1)
 def load_items_metadata():
-    """Load items acquisition metadata"""
+    """Load items acquisition metadata (parsed once; callers must not mutate the result)"""
     items_path = os.path.join(os.path.dirname(__file__), "data", "items_v1.json")
     try:
-        with open(items_path, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[ADVISOR WARNING] Failed to load items metadata: {e}")
+        with open(items_path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
+        logger.warning("Failed to load items metadata: %s", e)
         return {"items": []}
 
 
+@lru_cache(maxsize=1)
 def load_loadouts():
-    """Load loadouts data"""
+    """Load loadouts data (parsed once; callers must not mutate the result)"""
     loadouts_path = os.path.join(os.path.dirname(__file__), "data", "loadouts_v1.json")
     try:
-        with open(loadouts_path, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[ADVISOR WARNING] Failed to load loadouts: {e}")
+        with open(loadouts_path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
+        logger.warning("Failed to load loadouts: %s", e)
         return {"loadouts": []}
 
 
@@ -61,57 +68,64 @@ def get_loadout_for_level(loadouts_data: dict, membership: str, combat_level: in
     return matching[-1] if matching else None
 
 
-def get_item_acquisition(item_name: str, items_metadata: dict, membership: str, game_mode: str = "main") -> list:
-    """Get acquisition options for an item, mode-aware"""
-    items = items_metadata.get("items", [])
-    for item in items:
-        if item.get("name", "").lower() == item_name.lower():
-            # Filter by membership
-            if item.get("p2p", False) and membership == "f2p":
-                continue
-            
-            sources = item.get("sources", [])
-            
-            # Mode-aware filtering
-            if game_mode == "main":
-                # For main accounts: filter out low-probability drops as primary
-                # Keep quests, shops, craft, and common drops
-                # Low-probability drops (e.g., 1/32,768) should be marked as optional
-                filtered_sources = []
-                for source in sources:
-                    source_type = source.get("type")
-                    if source_type == "GE":
-                        filtered_sources.append(source)
-                    elif source_type == "Quest":
-                        filtered_sources.append(source)
-                    elif source_type == "Shop":
-                        filtered_sources.append(source)
-                    elif source_type == "Craft":
+@lru_cache(maxsize=1)
+def _items_metadata_by_name() -> dict:
+    """Lowercase item name -> matching items from load_items_metadata(), in file order"""
+    by_name = {}
+    for item in load_items_metadata().get("items", []):
+        by_name.setdefault(item.get("name", "").lower(), []).append(item)
+    return by_name
+
+
+def get_item_acquisition(item_name: str, membership: str, game_mode: str = "main") -> list:
+    """Get acquisition options for an item (from load_items_metadata()), mode-aware"""
+    for item in _items_metadata_by_name().get(item_name.lower(), []):
+        # Filter by membership
+        if item.get("p2p", False) and membership == "f2p":
+            continue
+        
+        sources = item.get("sources", [])
+        
+        # Mode-aware filtering
+        if game_mode == "main":
+            # For main accounts: filter out low-probability drops as primary
+            # Keep quests, shops, craft, and common drops
+            # Low-probability drops (e.g., 1/32,768) should be marked as optional
+            filtered_sources = []
+            for source in sources:
+                source_type = source.get("type")
+                if source_type == "GE":
+                    filtered_sources.append(source)
+                elif source_type == "Quest":
+                    filtered_sources.append(source)
+                elif source_type == "Shop":
+                    filtered_sources.append(source)
+                elif source_type == "Craft":
+                    filtered_sources.append(source)
+                elif source_type == "Drop":
+                    # Check if it's a common drop (not extremely rare)
+                    desc = source.get("description", "").lower()
+                    if "1/512" in desc or "1/128" in desc or "1/381" in desc:
+                        # Common enough for main accounts
                         filtered_sources.append(source)
-                    elif source_type == "Drop":
-                        # Check if it's a common drop (not extremely rare)
-                        desc = source.get("description", "").lower()
-                        if "1/512" in desc or "1/128" in desc or "1/381" in desc:
-                            # Common enough for main accounts
-                            filtered_sources.append(source)
-                        # Very rare drops (1/32k+) are excluded for main accounts
-                
-                # If no non-GE sources remain, use GE
-                if not any(s.get("type") != "GE" for s in filtered_sources):
-                    ge_sources = [s for s in sources if s.get("type") == "GE"]
-                    return ge_sources
-                
-                # Return non-GE first, then GE
-                non_ge = [s for s in filtered_sources if s.get("type") != "GE"]
-                ge = [s for s in filtered_sources if s.get("type") == "GE"]
-                return non_ge + ge
-            else:
-                # For iron accounts: prefer non-GE sources, avoid GE
-                non_ge_sources = [s for s in sources if s.get("type") != "GE"]
+                    # Very rare drops (1/32k+) are excluded for main accounts
+            
+            # If no non-GE sources remain, use GE
+            if not any(s.get("type") != "GE" for s in filtered_sources):
                 ge_sources = [s for s in sources if s.get("type") == "GE"]
-                # Return non-GE first, GE only as last resort
-                return non_ge_sources + ge_sources
-    
+                return ge_sources
+            
+            # Return non-GE first, then GE
+            non_ge = [s for s in filtered_sources if s.get("type") != "GE"]
+            ge = [s for s in filtered_sources if s.get("type") == "GE"]
+            return non_ge + ge
+        else:
+            # For iron accounts: prefer non-GE sources, avoid GE
+            non_ge_sources = [s for s in sources if s.get("type") != "GE"]
+            ge_sources = [s for s in sources if s.get("type") == "GE"]
+            # Return non-GE first, GE only as last resort
+            return non_ge_sources + ge_sources
+
     return []
 
 
@@ -126,27 +140,6 @@ def get_combat_bracket(combat_level: int, progression_data: dict) -> dict:
     return None
 
 
-def calculate_combat_level(skills: dict) -> int:
-    """Calculate combat level using standard OSRS formula"""
-    import math
-    
-    attack = skills.get("attack", 1)
-    strength = skills.get("strength", 1)
-    defence = skills.get("defence", 1)
-    hitpoints = skills.get("hitpoints", 10)
-    ranged = skills.get("ranged", 1)
-    magic = skills.get("magic", 1)
-    prayer = skills.get("prayer", 1)
-    
-    base = 0.25 * (defence + hitpoints + (prayer // 2))
-    melee = 0.325 * (attack + strength)
-    ranged_cb = 0.325 * (math.floor(ranged * 1.5) + (prayer // 2))
-    magic_cb = 0.325 * (math.floor(magic * 1.5) + (prayer // 2))
-    
-    combat = base + max(melee, ranged_cb, magic_cb)
-    return int(combat)
-
-
 def get_recipe_for_disaster_advice(profile: Profile, combat_level: int, total_level: int) -> AdviceItem:
     """Generate detailed Recipe for Disaster advice"""
     cooking = profile.skills.get("cooking", 1)
@@ -215,13 +208,12 @@ def get_recipe_for_disaster_advice(profile: Profile, combat_level: int, total_le
     )
 
 
-def get_gear_recommendation(bracket: dict, membership: str, combat_level: int, attack: int, strength: int, defence: int, game_mode: str = "main") -> Optional[AdviceItem]:
+def get_gear_recommendation(bracket: dict, membership: str, combat_level: int, game_mode: str = "main") -> Optional[AdviceItem]:
     """Generate loadout-based gear recommendation with acquisition options"""
     if not bracket:
         return None
     
     # Load data
-    items_metadata = load_items_metadata()
     loadouts_data = load_loadouts()
     
     # Determine context based on combat level
@@ -260,7 +252,7 @@ def get_gear_recommendation(bracket: dict, membership: str, combat_level: int, a
         req = loadout.get("requirements", {}).get(slot)
         
         # Get acquisition options
-        item_sources = get_item_acquisition(item, items_metadata, membership, game_mode)
+        item_sources = get_item_acquisition(item, membership, game_mode)
         
         if item_sources:
             # Get 2 options (prefer non-GE, then GE)
@@ -355,26 +347,27 @@ def get_training_recommendation(bracket: dict, membership: str, combat_level: in
             alt_name = s.get("name", "")
             if alt_name:
                 alternatives.append(alt_name)
+    alt_str = ', '.join(alternatives[:2])
     
     if combat_level < 50:
         if spot_name in ["Sand Crabs", "Ammonite Crabs"]:
-            why_over = f"{spot_name} provides better XP rates than {', '.join(alternatives[:2]) if alternatives else 'other early-game spots'} and is more AFK-friendly. Better than Al Kharid Warriors for XP/hour."
+            why_over = f"{spot_name} provides better XP rates than {alt_str or 'other early-game spots'} and is more AFK-friendly. Better than Al Kharid Warriors for XP/hour."
         else:
-            why_over = f"{spot_name} is the best training spot for your level. Better XP rates than {', '.join(alternatives[:2]) if alternatives else 'alternatives'} and safe for low-level players."
+            why_over = f"{spot_name} is the best training spot for your level. Better XP rates than {alt_str or 'alternatives'} and safe for low-level players."
     elif combat_level < 100:
         if spot_name == "Nightmare Zone":
-            why_over = f"Nightmare Zone is the best AFK training method. Better XP rates than Slayer tasks and more AFK than {', '.join(alternatives[:2]) if alternatives else 'other training methods'}."
+            why_over = f"Nightmare Zone is the best AFK training method. Better XP rates than Slayer tasks and more AFK than {alt_str or 'other training methods'}."
         elif "Slayer" in spot_name:
-            why_over = f"Slayer training provides variety and profit. Better long-term value than pure combat training at {', '.join(alternatives[:2]) if alternatives else 'other spots'}."
+            why_over = f"Slayer training provides variety and profit. Better long-term value than pure combat training at {alt_str or 'other spots'}."
         else:
-            why_over = f"{spot_name} provides efficient XP for your level. Better than {', '.join(alternatives[:2]) if alternatives else 'lower-level spots'} and more accessible than high-level methods."
+            why_over = f"{spot_name} provides efficient XP for your level. Better than {alt_str or 'lower-level spots'} and more accessible than high-level methods."
     else:
         if spot_name == "Nightmare Zone":
-            why_over = f"Nightmare Zone with Dharok's is the best AFK combat training. Better XP/hour than Slayer and more AFK than {', '.join(alternatives[:2]) if alternatives else 'other methods'}."
+            why_over = f"Nightmare Zone with Dharok's is the best AFK combat training. Better XP/hour than Slayer and more AFK than {alt_str or 'other methods'}."
         elif "Slayer" in spot_name:
-            why_over = f"High-level Slayer tasks are profitable and provide good XP. Better money than Nightmare Zone and unlocks unique content compared to {', '.join(alternatives[:2]) if alternatives else 'pure combat training'}."
+            why_over = f"High-level Slayer tasks are profitable and provide good XP. Better money than Nightmare Zone and unlocks unique content compared to {alt_str or 'pure combat training'}."
         else:
-            why_over = f"{spot_name} is optimal for your combat level. Better than {', '.join(alternatives[:2]) if alternatives else 'lower-level methods'}."
+            why_over = f"{spot_name} is optimal for your combat level. Better than {alt_str or 'lower-level methods'}."
     
     # Determine target stats based on current levels and combat level
     current_attack = attack
@@ -645,8 +638,8 @@ def get_nmz_efficiency_strategy(profile: Profile, combat_level: int) -> Strategy
 
 def get_strategies(profile: Profile) -> List[StrategyCard]:
     """Generate strategy cards based on player profile"""
-    combat_level = calculate_combat_level(profile.skills)
-    total_level = sum(profile.skills.values())
+    combat_level = profile.combat_level
+    total_level = profile.total_level
     
     # Check if beginner - return empty (beginners use beginner advice)
     if is_beginner_player(combat_level, total_level):
@@ -796,8 +789,8 @@ def get_advice(profile: Profile) -> list[AdviceItem]:
     For non-beginners, use get_strategies() instead which returns Strategy Cards.
     """
     # Calculate metrics
-    combat_level = calculate_combat_level(profile.skills)
-    total_level = sum(profile.skills.values())
+    combat_level = profile.combat_level
+    total_level = profile.total_level
     
     # Check if beginner - return beginner path
     if is_beginner_player(combat_level, total_level):
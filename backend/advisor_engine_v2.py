@@ -1,17 +1,22 @@
-import json
+import logging
 import os
-from models import Profile, AdviceItem
+import orjson
+from functools import lru_cache
+from models import Profile, AdviceItem, calculate_combat_level
 from typing import Optional, Tuple
 
+logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=1)
 def load_combat_progression():
-    """Load combat progression knowledge pack"""
+    """Load combat progression knowledge pack (parsed once; callers must not mutate the result)"""
     knowledge_path = os.path.join(os.path.dirname(__file__), "knowledge", "combat_progression.json")
     try:
-        with open(knowledge_path, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[ADVISOR WARNING] Failed to load combat progression: {e}")
+        with open(knowledge_path, 'rb') as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
+        logger.warning("Failed to load combat progression: %s", e)
         return {"combat_brackets": []}
 
 
@@ -26,27 +31,6 @@ def get_combat_bracket(combat_level: int, progression_data: dict) -> dict:
     return None
 
 
-def calculate_combat_level(skills: dict) -> int:
-    """Calculate combat level using standard OSRS formula"""
-    import math
-    
-    attack = skills.get("attack", 1)
-    strength = skills.get("strength", 1)
-    defence = skills.get("defence", 1)
-    hitpoints = skills.get("hitpoints", 10)
-    ranged = skills.get("ranged", 1)
-    magic = skills.get("magic", 1)
-    prayer = skills.get("prayer", 1)
-    
-    base = 0.25 * (defence + hitpoints + (prayer // 2))
-    melee = 0.325 * (attack + strength)
-    ranged_cb = 0.325 * (math.floor(ranged * 1.5) + (prayer // 2))
-    magic_cb = 0.325 * (math.floor(magic * 1.5) + (prayer // 2))
-    
-    combat = base + max(melee, ranged_cb, magic_cb)
-    return int(combat)
-
-
 def get_recipe_for_disaster_advice(profile: Profile, combat_level: int, total_level: int) -> AdviceItem:
     """Generate detailed Recipe for Disaster advice"""
     cooking = profile.skills.get("cooking", 1)
@@ -116,7 +100,7 @@ def get_recipe_for_disaster_advice(profile: Profile, combat_level: int, total_le
     )
 
 
-def get_gear_recommendation(bracket: dict, membership: str, combat_level: int, attack: int, strength: int, defence: int) -> Optional[AdviceItem]:
+def get_gear_recommendation(bracket: dict, membership: str, combat_level: int) -> Optional[AdviceItem]:
     """Generate gear/upgrade recommendation"""
     if not bracket:
         return None
@@ -192,26 +176,27 @@ def get_training_recommendation(bracket: dict, membership: str, combat_level: in
             alt_name = s.get("name", "")
             if alt_name:
                 alternatives.append(alt_name)
+    alt_str = ', '.join(alternatives[:2])
     
     if combat_level < 50:
         if spot_name in ["Sand Crabs", "Ammonite Crabs"]:
-            why_over = f"{spot_name} provides better XP rates than {', '.join(alternatives[:2]) if alternatives else 'other early-game spots'} and is more AFK-friendly. Better than Al Kharid Warriors for XP/hour."
+            why_over = f"{spot_name} provides better XP rates than {alt_str or 'other early-game spots'} and is more AFK-friendly. Better than Al Kharid Warriors for XP/hour."
         else:
-            why_over = f"{spot_name} is the best training spot for your level. Better XP rates than {', '.join(alternatives[:2]) if alternatives else 'alternatives'} and safe for low-level players."
+            why_over = f"{spot_name} is the best training spot for your level. Better XP rates than {alt_str or 'alternatives'} and safe for low-level players."
     elif combat_level < 100:
         if spot_name == "Nightmare Zone":
-            why_over = f"Nightmare Zone is the best AFK training method. Better XP rates than Slayer tasks and more AFK than {', '.join(alternatives[:2]) if alternatives else 'other training methods'}."
+            why_over = f"Nightmare Zone is the best AFK training method. Better XP rates than Slayer tasks and more AFK than {alt_str or 'other training methods'}."
         elif "Slayer" in spot_name:
-            why_over = f"Slayer training provides variety and profit. Better long-term value than pure combat training at {', '.join(alternatives[:2]) if alternatives else 'other spots'}."
+            why_over = f"Slayer training provides variety and profit. Better long-term value than pure combat training at {alt_str or 'other spots'}."
         else:
-            why_over = f"{spot_name} provides efficient XP for your level. Better than {', '.join(alternatives[:2]) if alternatives else 'lower-level spots'} and more accessible than high-level methods."
+            why_over = f"{spot_name} provides efficient XP for your level. Better than {alt_str or 'lower-level spots'} and more accessible than high-level methods."
     else:
         if spot_name == "Nightmare Zone":
-            why_over = f"Nightmare Zone with Dharok's is the best AFK combat training. Better XP/hour than Slayer and more AFK than {', '.join(alternatives[:2]) if alternatives else 'other methods'}."
+            why_over = f"Nightmare Zone with Dharok's is the best AFK combat training. Better XP/hour than Slayer and more AFK than {alt_str or 'other methods'}."
         elif "Slayer" in spot_name:
-            why_over = f"High-level Slayer tasks are profitable and provide good XP. Better money than Nightmare Zone and unlocks unique content compared to {', '.join(alternatives[:2]) if alternatives else 'pure combat training'}."
+            why_over = f"High-level Slayer tasks are profitable and provide good XP. Better money than Nightmare Zone and unlocks unique content compared to {alt_str or 'pure combat training'}."
         else:
-            why_over = f"{spot_name} is optimal for your combat level. Better than {', '.join(alternatives[:2]) if alternatives else 'lower-level methods'}."
+            why_over = f"{spot_name} is optimal for your combat level. Better than {alt_str or 'lower-level methods'}."
     
     steps = [
         f"Travel to {location}",
@@ -320,12 +305,22 @@ def get_advice(profile: Profile) -> list[AdviceItem]:
     - No filler steps
     - Comparative reasoning for each recommendation
     """
+    # Advice only depends on membership and skills, so repeat calls are cache hits
+    skills_key = tuple(sorted(profile.skills.items()))
+    return list(_get_advice_cached(profile.membership, skills_key))
+
+
+@lru_cache(maxsize=2048)
+def _get_advice_cached(membership: str, skills_key: Tuple[Tuple[str, int], ...]) -> Tuple[AdviceItem, ...]:
+    """Build advice for a (membership, skills) fingerprint"""
+    profile = Profile(membership=membership, skills=dict(skills_key))
+    
     # Load combat progression data
     progression_data = load_combat_progression()
     
     # Calculate metrics
     combat_level = calculate_combat_level(profile.skills)
-    total_level = sum(profile.skills.values())
+    total_level = profile.total_level
     attack = profile.skills.get("attack", 1)
     strength = profile.skills.get("strength", 1)
     defence = profile.skills.get("defence", 1)
@@ -334,14 +329,15 @@ def get_advice(profile: Profile) -> list[AdviceItem]:
     bracket = get_combat_bracket(combat_level, progression_data)
     
     # Generate one of each type
-    gear_item = get_gear_recommendation(bracket, profile.membership, combat_level, attack, strength, defence)
+    gear_item = get_gear_recommendation(bracket, profile.membership, combat_level)
     training_item = get_training_recommendation(bracket, profile.membership, combat_level, attack, strength, defence)
     quest_item = get_quest_recommendation(profile, combat_level, total_level)
     
     items = []
     primary_actions = set()
     
-    # Add items in order, checking for duplicates
+    # Add items in priority order, skipping duplicates. The generators are
+    # deterministic, so re-running them for a duplicate can't yield a new action.
     for item in [gear_item, training_item, quest_item]:
         if item:
             primary_action = get_primary_action(item)
@@ -349,32 +345,5 @@ def get_advice(profile: Profile) -> list[AdviceItem]:
                 items.append(item)
                 primary_actions.add(primary_action)
     
-    # Ensure we have exactly 3 items
-    while len(items) < 3:
-        # Fallback: generate missing type
-        if not gear_item or get_primary_action(gear_item) in primary_actions:
-            gear_item = get_gear_recommendation(bracket, profile.membership, combat_level, attack, strength, defence)
-            if gear_item and get_primary_action(gear_item) not in primary_actions:
-                items.append(gear_item)
-                primary_actions.add(get_primary_action(gear_item))
-                continue
-        
-        if not training_item or get_primary_action(training_item) in primary_actions:
-            training_item = get_training_recommendation(bracket, profile.membership, combat_level, attack, strength, defence)
-            if training_item and get_primary_action(training_item) not in primary_actions:
-                items.append(training_item)
-                primary_actions.add(get_primary_action(training_item))
-                continue
-        
-        if not quest_item or get_primary_action(quest_item) in primary_actions:
-            quest_item = get_quest_recommendation(profile, combat_level, total_level)
-            if quest_item and get_primary_action(quest_item) not in primary_actions:
-                items.append(quest_item)
-                primary_actions.add(get_primary_action(quest_item))
-                continue
-        
-        # Last resort: add any available item
-        break
-    
-    return items[:3]
+    return tuple(items[:3])
 
@@ -2,28 +2,33 @@
 Auto-construct gear options for builds using candidate items.
 Currently only supports nmz_melee context.
 """
-import json
+import logging
 import os
+import orjson
 from typing import Dict, List, Optional
 from build_synergy import validate_gear_tier, get_item_set, count_set_pieces, count_synergies, SYNERGY_RULES
 
+logger = logging.getLogger(__name__)
+
+
+_CANDIDATES_NMZ_MELEE_PATH = os.path.join(os.path.dirname(__file__), "data", "candidates_nmz_melee.json")
+
 
 def load_candidates(context: str) -> List[Dict]:
     """Load candidate items for a specific context"""
     if context != "nmz_melee":
         return []
     
-    candidates_path = os.path.join(os.path.dirname(__file__), "data", "candidates_nmz_melee.json")
     try:
-        with open(candidates_path, 'r') as f:
-            data = json.load(f)
+        with open(_CANDIDATES_NMZ_MELEE_PATH, 'rb') as f:
+            data = orjson.loads(f.read())
             return data.get("candidates", [])
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[BUILD CONSTRUCTOR WARNING] Failed to load candidates for {context}: {e}")
+    except (FileNotFoundError, orjson.JSONDecodeError) as e:
+        logger.warning("Failed to load candidates for %s: %s", context, e)
         return []
 
 
-def score_item(item: Dict, tier: str, current_gear: List[str], slot: str) -> float:
+def score_item(item: Dict, tier: str) -> float:
     """
     Score an item for selection. Higher score = better choice.
     Prefers strength then accuracy, avoids set_piece for budget.
@@ -90,7 +95,6 @@ def construct_gear_option(
     
     # Select one item per slot
     selected_gear = []
-    selected_items = []
     
     for slot in slots:
         # Get candidates for this slot
@@ -98,19 +102,24 @@ def construct_gear_option(
         if not slot_candidates:
             continue  # Skip slot if no candidates
         
-        # Score and sort candidates
-        scored = [(score_item(c, tier, selected_gear, slot), c) for c in slot_candidates]
-        scored.sort(reverse=True, key=lambda x: x[0])
+        # Score candidates; the top scorer usually passes, so only sort on a miss
+        scored = [(score_item(c, tier), c) for c in slot_candidates]
+        _, best = max(scored, key=lambda x: x[0])
+        
+        # Quick validation: check if adding this item would violate rules
+        is_valid, _ = validate_gear_tier(selected_gear + [best["name"]], tier)
+        if is_valid:
+            selected_gear.append(best["name"])
+            continue
         
-        # Try candidates in order until we find one that passes synergy rules
-        for score, candidate in scored:
+        # Try remaining candidates in score order until one passes synergy rules
+        for score, candidate in sorted(scored, key=lambda x: -x[0]):
+            if candidate is best:
+                continue
             test_gear = selected_gear + [candidate["name"]]
-            
-            # Quick validation: check if adding this item would violate rules
             is_valid, _ = validate_gear_tier(test_gear, tier)
             if is_valid:
                 selected_gear.append(candidate["name"])
-                selected_items.append(candidate)
                 break
     
     # Final validation
@@ -119,7 +128,7 @@ def construct_gear_option(
     
     is_valid, error_msg = validate_gear_tier(selected_gear, tier)
     if not is_valid:
-        print(f"[BUILD CONSTRUCTOR] Generated gear for tier '{tier}' failed validation: {error_msg}")
+        logger.warning("Generated gear for tier '%s' failed validation: %s", tier, error_msg)
         return None
     
     return selected_gear
@@ -163,7 +172,7 @@ def auto_construct_nmz_melee_build(
             new_options.append(new_option)
         else:
             # Fallback to original if construction failed
-            print(f"[BUILD CONSTRUCTOR] Failed to construct gear for tier '{tier}', using original")
+            logger.warning("Failed to construct gear for tier '%s', using original", tier)
             new_options.append(option)
     
     # Create new build with constructed gear
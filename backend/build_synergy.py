@@ -2,6 +2,8 @@
 Build synergy rules and constraints for gear tiers.
 Defines how different tiers should differ fundamentally, not just in power level.
 """
+import sys
+from collections import Counter
 from typing import Dict, List, Optional, Set, Tuple
 from items_db import get_item
 
@@ -37,16 +39,22 @@ SYNERGY_RULES = {
 
 # Known item sets (for synergy detection)
 ITEM_SETS = {
-    "dharok": {"Dharok's Helm", "Dharok's Platebody", "Dharok's Platelegs", "Dharok's Greataxe"},
-    "torag": {"Torag's Helm", "Torag's Platebody", "Torag's Platelegs", "Torag's Hammers"},
-    "verac": {"Verac's Helm", "Verac's Brassard", "Verac's Plateskirt", "Verac's Flail"},
-    "guthan": {"Guthan's Helm", "Guthan's Platebody", "Guthan's Chainskirt", "Guthan's Warspear"},
-    "ahrim": {"Ahrim's Hood", "Ahrim's Robetop", "Ahrim's Robeskirt", "Ahrim's Staff"},
-    "karil": {"Karil's Coif", "Karil's Leathertop", "Karil's Leatherskirt", "Karil's Crossbow"},
-    "dragon": {"Dragon Med Helm", "Dragon Chainbody", "Dragon Platelegs", "Dragon Scimitar", "Dragon Boots"},
-    "barrows_gloves": {"Barrows Gloves"},  # Special case: single item but part of quest set
+    "dharok": frozenset({"Dharok's Helm", "Dharok's Platebody", "Dharok's Platelegs", "Dharok's Greataxe"}),
+    "torag": frozenset({"Torag's Helm", "Torag's Platebody", "Torag's Platelegs", "Torag's Hammers"}),
+    "verac": frozenset({"Verac's Helm", "Verac's Brassard", "Verac's Plateskirt", "Verac's Flail"}),
+    "guthan": frozenset({"Guthan's Helm", "Guthan's Platebody", "Guthan's Chainskirt", "Guthan's Warspear"}),
+    "ahrim": frozenset({"Ahrim's Hood", "Ahrim's Robetop", "Ahrim's Robeskirt", "Ahrim's Staff"}),
+    "karil": frozenset({"Karil's Coif", "Karil's Leathertop", "Karil's Leatherskirt", "Karil's Crossbow"}),
+    "dragon": frozenset({"Dragon Med Helm", "Dragon Chainbody", "Dragon Platelegs", "Dragon Scimitar", "Dragon Boots"}),
+    "barrows_gloves": frozenset({"Barrows Gloves"}),  # Special case: single item but part of quest set
 }
 
+# Reverse index: lowercase item name -> set name (first set wins, matching scan order)
+_ITEM_TO_SET: Dict[str, str] = {}
+for _set_name, _set_items in ITEM_SETS.items():
+    for _set_item in _set_items:
+        _ITEM_TO_SET.setdefault(sys.intern(_set_item.lower()), _set_name)
+
 
 # Known synergies (item combinations that work well together)
 ITEM_SYNERGIES = {
@@ -72,21 +80,20 @@ ITEM_SYNERGIES = {
 def get_item_set(item_name: str) -> Optional[str]:
     """Get the set name an item belongs to, if any."""
     item_lower = item_name.lower()
-    for set_name, set_items in ITEM_SETS.items():
-        for set_item in set_items:
-            if set_item.lower() in item_lower or item_lower in set_item.lower():
-                return set_name
+    set_name = _ITEM_TO_SET.get(item_lower)
+    if set_name is not None:
+        return set_name
+    
+    # Fall back to partial name matching (e.g., "Dharok's Helm 100")
+    for set_item_lower, set_name in _ITEM_TO_SET.items():
+        if set_item_lower in item_lower or item_lower in set_item_lower:
+            return set_name
     return None
 
 
 def count_set_pieces(gear: List[str]) -> Dict[str, int]:
     """Count how many pieces from each set are in the gear list."""
-    set_counts = {}
-    for item in gear:
-        set_name = get_item_set(item)
-        if set_name:
-            set_counts[set_name] = set_counts.get(set_name, 0) + 1
-    return set_counts
+    return Counter(set_name for item in gear if (set_name := get_item_set(item)))
 
 
 def count_synergies(gear: List[str]) -> int:
@@ -109,11 +116,31 @@ def validate_gear_tier(gear: List[str], tier: str) -> Tuple[bool, Optional[str]]
     """
     if tier not in SYNERGY_RULES:
         return False, f"Unknown tier: {tier}"
-    
+    return _check_tier_rules(gear, count_set_pieces(gear), tier)
+
+
+def validate_gear_tiers_batch(pairs: List[Tuple[List[str], str]]) -> List[Tuple[bool, Optional[str]]]:
+    """
+    Validate several (gear, tier) pairs, e.g. all gear options of one build.
+    Set membership is resolved once per distinct item across all pairs.
+    Returns one (is_valid, error_message) per pair, in order.
+    """
+    item_sets = {item: get_item_set(item) for gear, _ in pairs for item in gear}
+    results = []
+    for gear, tier in pairs:
+        if tier not in SYNERGY_RULES:
+            results.append((False, f"Unknown tier: {tier}"))
+            continue
+        set_counts = Counter(set_name for item in gear if (set_name := item_sets[item]))
+        results.append(_check_tier_rules(gear, set_counts, tier))
+    return results
+
+
+def _check_tier_rules(gear: List[str], set_counts: Dict[str, int], tier: str) -> Tuple[bool, Optional[str]]:
+    """Apply a known tier's rules given the gear's per-set piece counts"""
     rules = SYNERGY_RULES[tier]
     
     # Check set piece limits
-    set_counts = count_set_pieces(gear)
     max_set_pieces = rules["max_set_pieces"]
     for set_name, count in set_counts.items():
         if count > max_set_pieces:
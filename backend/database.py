@@ -1,9 +1,14 @@
-import json
 import os
-from sqlalchemy import create_engine, Column, Integer, String, Text, Boolean
+import threading
+import orjson
+from typing import Dict, Optional, Tuple
+from sqlalchemy import create_engine, event, text, Column, Integer, String, Text, Boolean
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from models import Profile, PlayerSetup
+from hiscores import SKILL_NAMES
 
 Base = declarative_base()
 
@@ -17,23 +22,141 @@ class ProfileModel(Base):
     membership = Column(String, default="f2p")
     goals = Column(Text, nullable=True)  # JSON array as string
     playtime_minutes = Column(Integer, default=0)
-    skills = Column(Text, nullable=True)  # JSON dict as string
+    skills = Column(Text, nullable=True)  # JSON dict of custom (non-hiscores) skills
     setup_style = Column(String, default="")
     setup_priority = Column(String, default="")
     setup_effort = Column(String, default="")
 
+    # One column per hiscores skill; NULL means the profile doesn't track it
+    attack = Column(Integer, nullable=True)
+    defence = Column(Integer, nullable=True)
+    strength = Column(Integer, nullable=True)
+    hitpoints = Column(Integer, nullable=True)
+    ranged = Column(Integer, nullable=True)
+    prayer = Column(Integer, nullable=True)
+    magic = Column(Integer, nullable=True)
+    cooking = Column(Integer, nullable=True)
+    woodcutting = Column(Integer, nullable=True)
+    fletching = Column(Integer, nullable=True)
+    fishing = Column(Integer, nullable=True)
+    firemaking = Column(Integer, nullable=True)
+    crafting = Column(Integer, nullable=True)
+    smithing = Column(Integer, nullable=True)
+    mining = Column(Integer, nullable=True)
+    herblore = Column(Integer, nullable=True)
+    agility = Column(Integer, nullable=True)
+    thieving = Column(Integer, nullable=True)
+    slayer = Column(Integer, nullable=True)
+    farming = Column(Integer, nullable=True)
+    runecraft = Column(Integer, nullable=True)
+    hunter = Column(Integer, nullable=True)
+    construction = Column(Integer, nullable=True)
+
+
+# Skills stored in their own columns (hiscores order, without overall)
+SKILL_COLUMNS = SKILL_NAMES[1:]
+_SKILL_COLUMN_SET = frozenset(SKILL_COLUMNS)
+
 
 # Database setup
 DATABASE_PATH = os.getenv("DATABASE_PATH", "/data/app.db")
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+# The profiles table holds a single row
+PROFILE_ID = 1
+
+# Keep a pool of long-lived connections so SQLite's page cache stays warm
+# between requests instead of being rebuilt on every connect.
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False, "timeout": 30},
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=5,
+    pool_recycle=-1,
+    pool_pre_ping=False
+)
+
+
+@event.listens_for(engine, "connect")
+def _configure_connection(dbapi_connection, connection_record):
+    """Per-connection SQLite settings (runs once per pooled connection)"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")  # readers don't block on profile saves
+    cursor.execute("PRAGMA synchronous=NORMAL")  # no fsync per commit in WAL mode
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    cursor.execute("PRAGMA cache_size=-64000")  # 64 MB page cache
+    cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# In-process cache of the singleton profile row, updated on every save.
+# Cached objects are shared between requests and must be treated as read-only.
+_cache_lock = threading.RLock()
+_profile_cache: Optional[Profile] = None
+_setup_cache: Optional[PlayerSetup] = None
+
+
+def _dumps(value) -> str:
+    """Serialize a value to a JSON string for Text columns"""
+    return orjson.dumps(value).decode()
+
 
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
+    _migrate_skill_columns()
+
+
+def close_db():
+    """Close all pooled connections (call on app shutdown)"""
+    engine.dispose()
+
+
+def _migrate_skill_columns():
+    """
+    Add per-skill columns to older databases and move skills out of the JSON blob.
+    One-way: afterwards the skills column only holds custom (non-hiscores) skills,
+    so code from before the skill columns would read profiles without their
+    hiscores levels. Back up the database file before rolling back past this.
+    """
+    with engine.begin() as conn:
+        existing = {row[1] for row in conn.execute(text("PRAGMA table_info(profiles)"))}
+        missing = [name for name in SKILL_COLUMNS if name not in existing]
+        if not missing:
+            return
+        for name in missing:
+            conn.execute(text(f"ALTER TABLE profiles ADD COLUMN {name} INTEGER"))
+        
+        for row_id, skills_json in conn.execute(text("SELECT id, skills FROM profiles")).all():
+            values = _skills_to_values(orjson.loads(skills_json) if skills_json else {})
+            assignments = ", ".join(f"{name} = :{name}" for name in values)
+            conn.execute(
+                text(f"UPDATE profiles SET {assignments} WHERE id = :id"),
+                {**values, "id": row_id}
+            )
+
+
+def _skills_from_row(profile_row: ProfileModel) -> Dict[str, int]:
+    """Rebuild the skills dict from the skill columns plus any custom skills"""
+    skills = {
+        name: level
+        for name in SKILL_COLUMNS
+        if (level := getattr(profile_row, name)) is not None
+    }
+    if profile_row.skills:
+        skills.update(orjson.loads(profile_row.skills))
+    return skills
+
+
+def _skills_to_values(skills: Dict[str, int]) -> dict:
+    """Split a skills dict into skill column values and the custom-skills JSON"""
+    values = {name: skills.get(name) for name in SKILL_COLUMNS}
+    extra = {name: level for name, level in skills.items() if name not in _SKILL_COLUMN_SET}
+    values["skills"] = _dumps(extra) if extra else None
+    return values
 
 
 def get_default_profile() -> Profile:
@@ -58,96 +181,100 @@ def get_default_profile() -> Profile:
 
 def get_profile() -> Profile:
     """Get the stored profile or return default"""
+    return get_profile_and_setup()[0]
+
+
+def get_setup() -> PlayerSetup:
+    """Get the stored player setup or return default"""
+    return get_profile_and_setup()[1]
+
+
+def get_profile_and_setup() -> Tuple[Profile, PlayerSetup]:
+    """Get the stored profile and player setup (both come from the same row)"""
+    global _profile_cache, _setup_cache
+    with _cache_lock:
+        if _profile_cache is None or _setup_cache is None:
+            _profile_cache, _setup_cache = _load_profile_and_setup()
+        return _profile_cache, _setup_cache
+
+
+def _load_profile_and_setup() -> Tuple[Profile, PlayerSetup]:
+    """Read the profile row once and build both models (creates default if none exists)"""
     db = SessionLocal()
     try:
-        profile_row = db.query(ProfileModel).first()
+        profile_row = db.get(ProfileModel, PROFILE_ID)
         if not profile_row:
             default = get_default_profile()
             save_profile(default)
-            return default
+            return default, PlayerSetup()
         
-        return Profile(
+        profile = Profile(
             player_name=profile_row.player_name or "",
             game_mode=profile_row.game_mode,
             membership=profile_row.membership,
-            goals=json.loads(profile_row.goals) if profile_row.goals else [],
+            goals=orjson.loads(profile_row.goals) if profile_row.goals else [],
             playtime_minutes=profile_row.playtime_minutes,
-            skills=json.loads(profile_row.skills) if profile_row.skills else {}
+            skills=_skills_from_row(profile_row)
         )
-    finally:
-        db.close()
-
-
-def get_setup() -> PlayerSetup:
-    """Get the stored player setup or return default"""
-    db = SessionLocal()
-    try:
-        profile_row = db.query(ProfileModel).first()
-        if not profile_row:
-            return PlayerSetup()
-        
-        return PlayerSetup(
+        setup = PlayerSetup(
             style=profile_row.setup_style or "",
             priority=profile_row.setup_priority or "",
             effort=profile_row.setup_effort or ""
         )
+        return profile, setup
     finally:
         db.close()
 
 
-def save_setup(setup: PlayerSetup):
-    """Save or update the player setup"""
+def _upsert_profile_row(values: dict):
+    """Insert or update the singleton profile row in a single statement"""
+    stmt = sqlite_insert(ProfileModel).values(id=PROFILE_ID, **values)
+    stmt = stmt.on_conflict_do_update(index_elements=[ProfileModel.id], set_=values)
     db = SessionLocal()
     try:
-        profile_row = db.query(ProfileModel).first()
-        
-        if profile_row:
-            # Update existing
-            profile_row.setup_style = setup.style
-            profile_row.setup_priority = setup.priority
-            profile_row.setup_effort = setup.effort
-        else:
-            # Create new profile with setup
-            profile_row = ProfileModel(
-                setup_style=setup.style,
-                setup_priority=setup.priority,
-                setup_effort=setup.effort
-            )
-            db.add(profile_row)
-        
+        db.execute(stmt)
         db.commit()
     finally:
         db.close()
 
 
+def save_setup(setup: PlayerSetup):
+    """Save or update the player setup"""
+    global _setup_cache
+    with _cache_lock:
+        _upsert_profile_row({
+            "setup_style": setup.style,
+            "setup_priority": setup.priority,
+            "setup_effort": setup.effort
+        })
+        _setup_cache = setup
+
+
 def save_profile(profile: Profile):
     """Save or update the profile"""
-    db = SessionLocal()
-    try:
-        profile_row = db.query(ProfileModel).first()
-        
-        if profile_row:
-            # Update existing
-            profile_row.player_name = profile.player_name
-            profile_row.game_mode = profile.game_mode
-            profile_row.membership = profile.membership
-            profile_row.goals = json.dumps(profile.goals)
-            profile_row.playtime_minutes = profile.playtime_minutes
-            profile_row.skills = json.dumps(profile.skills)
-            # Note: setup fields are managed separately via save_setup()
-        else:
-            # Create new
-            profile_row = ProfileModel(
-                player_name=profile.player_name,
-                game_mode=profile.game_mode,
-                membership=profile.membership,
-                goals=json.dumps(profile.goals),
-                playtime_minutes=profile.playtime_minutes,
-                skills=json.dumps(profile.skills)
-            )
-            db.add(profile_row)
-        
-        db.commit()
-    finally:
-        db.close()
+    global _profile_cache
+    with _cache_lock:
+        # Note: setup fields are managed separately via save_setup()
+        _upsert_profile_row({
+            "player_name": profile.player_name,
+            "game_mode": profile.game_mode,
+            "membership": profile.membership,
+            "goals": _dumps(profile.goals),
+            "playtime_minutes": profile.playtime_minutes,
+            **_skills_to_values(profile.skills)
+        })
+        _profile_cache = profile
+
 
+def update_profile_with_skills(player_name: str, skills: Dict[str, int]) -> Profile:
+    """Replace the player name and skills in one write, keeping the rest of the profile"""
+    global _profile_cache
+    with _cache_lock:
+        _upsert_profile_row({"player_name": player_name, **_skills_to_values(skills)})
+        if _profile_cache is not None:
+            _profile_cache = Profile(**{
+                **_profile_cache.model_dump(),
+                "player_name": player_name,
+                "skills": skills
+            })
+        return get_profile()
@@ -1,19 +1,72 @@
+import logging
 import httpx
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote
 
+logger = logging.getLogger(__name__)
+
 
 # OSRS skill names in hiscores order
-SKILL_NAMES = [
+SKILL_NAMES = (
     "overall", "attack", "defence", "strength", "hitpoints",
     "ranged", "prayer", "magic", "cooking", "woodcutting",
     "fletching", "fishing", "firemaking", "crafting", "smithing",
     "mining", "herblore", "agility", "thieving", "slayer",
     "farming", "runecraft", "hunter", "construction"
-]
+)
+
+# Skill rows after the overall line (line 1 onward)
+_SKILL_NAMES_NO_OVERALL: Tuple[str, ...] = SKILL_NAMES[1:]
+
+# Shared keep-alive client so repeat imports reuse the TLS connection. Created
+# on first use (inside the running event loop) and dropped on shutdown, so a
+# later app lifespan in the same process gets a fresh client.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it if needed"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10)
+        )
+    return _client
+
+
+async def close_client():
+    """Close the shared HTTP client (call on app shutdown)"""
+    global _client
+    if _client is not None:
+        client, _client = _client, None
+        await client.aclose()
+
+
+def _parse_skill_lines(lines: List[str]) -> Dict[str, int]:
+    """
+    Parse hiscores rows one at a time, tolerating malformed lines.
+    Each line format: rank,level,xp
+    """
+    skills = {}
+    for skill_name, line in zip(_SKILL_NAMES_NO_OVERALL, lines[1:]):
+        line = line.strip()
+        if line:
+            # Parse line: rank,level,xp
+            parts = line.split(',')
+            if len(parts) >= 2:
+                try:
+                    # Extract level (second field, index 1)
+                    level = int(parts[1].strip())
+                    skills[skill_name] = level
+                except (ValueError, IndexError) as e:
+                    logger.warning("Failed to parse level for %s from line '%s': %s", skill_name, line, e)
+                    skills[skill_name] = 1
+    return skills
 
 
-def fetch_hiscores(player_name: str) -> Tuple[Optional[Dict[str, int]], Optional[str]]:
+async def fetch_hiscores(player_name: str) -> Tuple[Optional[Dict[str, int]], Optional[str]]:
     """
     Fetch OSRS hiscores for a player and return skills as a dict.
     Returns (skills_dict, error_message) tuple.
@@ -28,60 +81,48 @@ def fetch_hiscores(player_name: str) -> Tuple[Optional[Dict[str, int]], Optional
     url = f"https://secure.runescape.com/m=hiscore_oldschool/index_lite.ws?player={encoded_name}"
     
     try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            
-            # Get raw response as plain text (NOT JSON)
-            raw_content = response.text
-            print(f"[HISCORES DEBUG] Raw response for player '{player_name}': {raw_content[:500]}...")  # Log first 500 chars
-            
-            content = raw_content.strip()
-            
-            # Check if response is empty or starts with "404"
-            if not content:
-                return None, "Player not found on OSRS hiscores"
-            
-            if content.startswith("404"):
-                return None, "Player not found on OSRS hiscores"
-            
-            # Parse plain text response - split by newline
-            lines = content.split('\n')
-            if len(lines) < 2:  # Need at least overall + one skill
-                return None, "Invalid hiscores response format"
-            
-            skills = {}
-            
-            # OSRS hiscores order: Overall (line 0), Attack (line 1), Defence (line 2), Strength (line 3), etc.
-            # Skip overall (index 0), map remaining lines to skills
-            # Each line format: rank,level,xp
-            for i, skill_name in enumerate(SKILL_NAMES[1:], start=1):
-                if i < len(lines):
-                    line = lines[i].strip()
-                    if line:
-                        # Parse line: rank,level,xp
-                        parts = line.split(',')
-                        if len(parts) >= 2:
-                            try:
-                                # Extract level (second field, index 1)
-                                level = int(parts[1].strip())
-                                skills[skill_name] = level
-                            except (ValueError, IndexError) as e:
-                                print(f"[HISCORES WARNING] Failed to parse level for {skill_name} from line '{line}': {e}")
-                                skills[skill_name] = 1
-            
-            if not skills:
-                return None, "No skills data found in hiscores response"
-            
-            print(f"[HISCORES DEBUG] Successfully parsed {len(skills)} skills")
-            return skills, None
-            
+        response = await _get_client().get(url)
+        response.raise_for_status()
+        
+        # Get raw response as plain text (NOT JSON)
+        raw_content = response.text
+        content = raw_content.strip()
+        
+        # Check if response is empty or starts with "404"
+        if not content:
+            return None, "Player not found on OSRS hiscores"
+        
+        if content.startswith("404"):
+            return None, "Player not found on OSRS hiscores"
+        
+        # Parse plain text response - one "rank,level,xp" row per line
+        lines = content.splitlines()
+        if len(lines) < 2:  # Need at least overall + one skill
+            return None, "Invalid hiscores response format"
+        
+        # OSRS hiscores order: Overall (line 0), Attack (line 1), Defence (line 2), Strength (line 3), etc.
+        # Skip overall (index 0), map remaining lines to skills
+        try:
+            skills = {
+                skill_name: int(line.split(',', 2)[1])
+                for skill_name, line in zip(_SKILL_NAMES_NO_OVERALL, lines[1:])
+                if line
+            }
+        except (ValueError, IndexError):
+            # Malformed row somewhere - fall back to tolerant per-line parsing
+            skills = _parse_skill_lines(lines)
+        
+        if not skills:
+            return None, "No skills data found in hiscores response"
+        
+        return skills, None
+        
     except (httpx.HTTPError, httpx.TimeoutException) as e:
         error_msg = f"Error fetching hiscores: {str(e)}"
-        print(f"[HISCORES ERROR] {error_msg}")
+        logger.error(error_msg)
         return None, error_msg
     except ValueError as e:
         error_msg = f"Error parsing hiscores data: {str(e)}"
-        print(f"[HISCORES ERROR] {error_msg}")
+        logger.error(error_msg)
         return None, error_msg
 
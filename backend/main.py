@@ -1,18 +1,30 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
-from models import Profile, AdviceResponse, DetailsResponse, StrategyResponse, StrategyCard, BeginnerPathResponse, BeginnerCard, PlayerSetup, BuildCard, NextStrategyResponse, AdviceCard, AdviceOptionsResponse, AdviceOption, AlternateSpot
+from pydantic import BaseModel, field_validator
+from models import Profile, AdviceResponse, DetailsResponse, StrategyResponse, StrategyCard, BeginnerPathResponse, BeginnerCard, PlayerSetup, BuildCard, NextStrategyResponse, AdviceCard, AdviceOptionsResponse, AdviceOption
 from spot_rotation import get_alternate_spots
-from database import init_db, get_profile, save_profile, get_setup, save_setup
-from advisor_engine import get_advice, get_strategies, get_beginner_cards, is_beginner_player, calculate_combat_level
-from hiscores import fetch_hiscores
+from database import init_db, close_db, get_profile, save_profile, get_setup, save_setup, get_profile_and_setup, update_profile_with_skills
+from advisor_engine import get_advice, get_strategies, get_beginner_cards, is_beginner_player, load_items_metadata
+from hiscores import fetch_hiscores, close_client as close_hiscores_client
 from items_db import load_items_db  # Load items DB at startup
-from build_synergy import validate_gear_tier, get_tier_description  # Synergy validation
+from build_synergy import validate_gear_tiers_batch, get_tier_description  # Synergy validation
 from build_constructor import auto_construct_nmz_melee_build  # Auto-construct builds
+import hashlib
+import logging
 import os
-import json
-from typing import List, Optional, Dict
+import re
+import threading
+import orjson
+from bisect import bisect_right
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
+
+logger = logging.getLogger(__name__)
 
 # Initialize database
 init_db()
@@ -20,7 +32,7 @@ init_db()
 # Load items database at startup
 load_items_db()
 
-app = FastAPI(title="RuneScape Lite Advisor API")
+app = FastAPI(title="RuneScape Lite Advisor API", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -31,6 +43,46 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON bodies (repeated phrases and keys compress well); small
+# responses and 304s go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release shared network clients and pooled DB connections"""
+    await close_hiscores_client()
+    close_db()
+
+
+# Concurrent requests computing the same response share one computation.
+# Keys use id() of the cached profile/setup objects: every save replaces the
+# cached instance, and in-flight requests keep theirs alive, so ids can't collide.
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _coalesced(key: tuple, compute):
+    """Run compute() once for concurrent callers with the same key; the rest wait for its result"""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight[key] = Future()
+    if not is_owner:
+        return future.result()
+    
+    try:
+        result = compute()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+    future.set_result(result)
+    return result
+
 
 @app.get("/health")
 async def health():
@@ -39,13 +91,13 @@ async def health():
 
 
 @app.get("/profile", response_model=Profile)
-async def get_user_profile():
+def get_user_profile():
     """Get the current user profile (creates default if none exists)"""
     return get_profile()
 
 
 @app.put("/profile")
-async def update_profile(profile: Profile):
+def update_profile(profile: Profile):
     """Update and save the user profile"""
     try:
         save_profile(profile)
@@ -55,7 +107,7 @@ async def update_profile(profile: Profile):
 
 
 @app.post("/advice", response_model=AdviceResponse)
-async def get_advice_endpoint():
+def get_advice_endpoint():
     """Get advice based on the current stored profile (beginners only)"""
     profile = get_profile()
     advice_items = get_advice(profile)
@@ -63,11 +115,184 @@ async def get_advice_endpoint():
 
 
 @app.get("/strategies", response_model=StrategyResponse)
-async def get_strategies_endpoint():
+def get_strategies_endpoint():
     """Get strategy cards based on the current stored profile"""
     profile = get_profile()
-    strategies = get_strategies(profile)
-    return StrategyResponse(strategies=strategies)
+    return _coalesced(
+        ("strategies", id(profile)),
+        lambda: StrategyResponse(strategies=get_strategies(profile))
+    )
+
+
+# Decision tables for get_next_strategy, built once at import.
+# Quest path: bands by total level (<300, <750, rest) -> membership -> (do_this, why, prep)
+_QUEST_LEVELS = (300, 750)
+_QUEST_BANDS = (
+    dict.fromkeys(("f2p", "p2p"), (
+        "Complete Waterfall Quest for instant 13,750 Attack and Strength XP",
+        ("Waterfall Quest provides massive early combat XP with minimal requirements",
+         "Unlocks access to new areas and is a prerequisite for Recipe for Disaster"),
+        ("Get 10 Agility (can be done at Gnome Stronghold)",),
+    )),
+    {
+        "p2p": (
+            "Work toward Recipe for Disaster subquests to unlock Barrows Gloves",
+            ("Barrows Gloves are best-in-slot melee gloves for most builds",
+             "Recipe for Disaster unlocks many other quests and content"),
+            ("Complete prerequisite quests: Cook's Assistant, Goblin Diplomacy",),
+        ),
+        "f2p": (
+            "Complete Dragon Slayer I for Rune Platebody and access to Elvarg",
+            ("Dragon Slayer unlocks a powerful F2P armor piece",
+             "Engages with F2P bossing content"),
+            ("Reach 32 Quest Points and complete required quests",),
+        ),
+    },
+    {
+        "p2p": (
+            "Focus on Grandmaster quests or quest cape for max rewards",
+            ("High-level quests unlock powerful items and areas",
+             "Quest completion provides significant XP lamps and utility"),
+            (),
+        ),
+        "f2p": (
+            "Complete all remaining F2P quests for quest points and rewards",
+            ("Maximizes F2P content completion",
+             "Prepares for potential membership benefits"),
+            (),
+        ),
+    },
+)
+
+# Money path: membership -> (combat level threshold, (below, at/above)) of (do_this, why)
+_MONEY_BANDS = {
+    "f2p": (30, (
+        ("Collect Cowhides in Lumbridge or mine Clay in Varrock",
+         ("Low requirements, consistent income", "Funds early gear and supplies")),
+        ("Kill Hill Giants for Limpwurt Roots and Big Bones in Edgeville Dungeon",
+         ("Good F2P combat XP and drops", "Consistent GP for mid-level F2P players")),
+    )),
+    "p2p": (60, (
+        ("Collect Snape Grass on Waterbirth Island or do early Slayer tasks",
+         ("Low-level P2P money maker", "Slayer provides combat XP and drops")),
+        ("Farm herbs, do high-level Slayer, or run Barrows",
+         ("High-profit methods for mid-to-high level players", "Funds expensive gear and supplies")),
+    )),
+}
+
+# Fast XP path: bands by lane stat (<20, <40, <60, <70, rest). Each row is
+# (target_level or None for stat+10, f2p location, p2p location, gear, why templates, prep).
+_FAST_XP_LEVELS = (20, 40, 60, 70)
+_MELEE_WHY = "Your melee stats ({attack} Attack, {strength} Strength) are your lowest combat stats"
+_MELEE_HIGH = (None, "Hill Giants", "Sand Crabs", "using a scimitar",
+               (_MELEE_WHY, "Balancing combat stats improves overall account progression"), ())
+_MELEE_BANDS = (
+    (20, "Al Kharid Warriors", "Lumbridge Cows", "using a scimitar",
+     ("Reaching 20 {stat_name} unlocks better weapons and faster training",
+      "Scimitar is the fastest weapon type for melee XP"),
+     ("Get a scimitar (buy from Varrock or Al Kharid)",)),
+    (40, "Al Kharid Warriors", "Rock Crabs", "using a scimitar",
+     (_MELEE_WHY, "Reaching 40 {stat_name} unlocks better training spots and gear"), ()),
+    (60, "Hill Giants", "Sand Crabs", "using a scimitar",
+     (_MELEE_WHY, "Reaching 60 {stat_name} unlocks mid-game training methods"), ()),
+    _MELEE_HIGH,
+    _MELEE_HIGH[:2] + ("Nightmare Zone",) + _MELEE_HIGH[3:],
+)
+
+_RANGED_WHY = "Ranged ({ranged}) is your lowest combat stat"
+_RANGED_HIGH = (None, "Hill Giants", "Sand Crabs", "using a shortbow",
+                (_RANGED_WHY, "Balancing combat stats improves overall account progression"), ())
+_RANGED_BANDS = (
+    (20, "Lumbridge Cows", "Lumbridge Cows", "using a shortbow",
+     ("Ranged is your lowest combat stat and unlocks safe training methods",
+      "Shortbow is the fastest early-game ranged weapon"),
+     ("Get a shortbow and arrows",)),
+    (40, "Al Kharid Warriors", "Rock Crabs", "using a shortbow",
+     (_RANGED_WHY, "Reaching 40 Ranged unlocks better training spots and gear"), ()),
+    (60, "Hill Giants", "Sand Crabs", "using a shortbow",
+     (_RANGED_WHY, "Reaching 60 Ranged unlocks mid-game training methods"), ()),
+    _RANGED_HIGH,
+    _RANGED_HIGH[:2] + ("Nightmare Zone",) + _RANGED_HIGH[3:],
+)
+
+_MAGIC_WHY = "Magic ({magic}) is your lowest combat stat"
+_MAGIC_HIGH = (None, "Hill Giants", "Sand Crabs", "using Fire Bolt",
+               (_MAGIC_WHY, "Balancing combat stats improves overall account progression"),
+               ("Get runes: fire and chaos",))
+_MAGIC_BANDS = (
+    (20, "Chickens (Lumbridge)", "Chickens (Lumbridge)", "using Wind Strike",
+     ("Magic is your lowest combat stat and unlocks utility spells",
+      "Wind Strike is the fastest early-game magic training method"),
+     ("Get runes: air and mind",)),
+    (40, "Al Kharid Warriors", "Rock Crabs", "using Fire Strike",
+     (_MAGIC_WHY, "Reaching 40 Magic unlocks better spells and training methods"),
+     ("Get runes: fire and mind",)),
+    (60, "Hill Giants", "Sand Crabs", "using Fire Bolt",
+     (_MAGIC_WHY, "Reaching 60 Magic unlocks mid-game training methods"),
+     ("Get runes: fire and chaos",)),
+    _MAGIC_HIGH,
+    _MAGIC_HIGH[:2] + ("Nightmare Zone",) + _MAGIC_HIGH[3:],
+)
+
+
+# "Train ..." sentence per lane; {location} and {gear} are filled in at import below
+_DO_THIS_TEMPLATES = {
+    "melee": "Train {stat_name} to {target_level} at {location} {gear}",
+    "ranged": "Train Ranged to {target_level} on {location} {gear}",
+    "magic": "Train Magic to {target_level} {gear} on {location}",
+}
+
+
+def _specialize_bands(bands: tuple, lane: str, membership: str) -> tuple:
+    """Resolve a lane's band table for one membership: (target, location, do_this template, why, prep)"""
+    rows = []
+    for target, f2p_location, p2p_location, gear, why, prep in bands:
+        location = p2p_location if membership == "p2p" else f2p_location
+        do_this_template = _DO_THIS_TEMPLATES[lane].format(
+            location=location, gear=gear, stat_name="{stat_name}", target_level="{target_level}"
+        )
+        rows.append((target, location, do_this_template, why, prep))
+    return tuple(rows)
+
+
+# Fast XP lanes by index: (lane, (primary stat, stat name) getter taking
+# (attack, strength, ranged, magic), band tables specialized per membership so
+# the hot path has no membership branches)
+_LANE_CONFIG = tuple(
+    (lane, stat_getter, {
+        membership: _specialize_bands(bands, lane, membership) for membership in ("f2p", "p2p")
+    })
+    for lane, stat_getter, bands in (
+        # Use the lower of Attack or Strength for melee recommendations
+        ("melee", lambda attack, strength, ranged, magic: (min(attack, strength), "Attack" if attack <= strength else "Strength"),
+         _MELEE_BANDS),
+        ("ranged", lambda attack, strength, ranged, magic: (ranged, "Ranged"), _RANGED_BANDS),
+        ("magic", lambda attack, strength, ranged, magic: (magic, "Magic"), _MAGIC_BANDS),
+    )
+)
+
+
+def _fast_xp_advice(membership: str, attack: int, strength: int, ranged: int, magic: int) -> tuple:
+    """Fast XP recommendation for the lowest combat lane: (lane, location, target_level, do_this, why, prep)"""
+    # Determine lane by lowest combat stat (ties prefer melee, then ranged)
+    # Melee = average of Attack and Strength, compared as a sum to stay in ints
+    melee_sum = attack + strength
+    lane_idx = 0 if melee_sum <= 2 * ranged and melee_sum <= 2 * magic else (1 if ranged <= magic else 2)
+    lane, stat_getter, bands_by_membership = _LANE_CONFIG[lane_idx]
+    
+    # Determine target level and training spot based on lane and current level
+    primary_stat, stat_name = stat_getter(attack, strength, ranged, magic)
+    target, location, do_this_template, why, prep = bands_by_membership[membership][bisect_right(_FAST_XP_LEVELS, primary_stat)]
+    target_level = target or min(primary_stat + 10, 99)
+    do_this = do_this_template.format(stat_name=stat_name, target_level=target_level)
+    
+    why_bullets = [
+        bullet.format(stat_name=stat_name, attack=attack, strength=strength, ranged=ranged, magic=magic)
+        for bullet in why
+    ]
+    
+    # Prep bullets for fast_xp path (only things required to start, max 2, no gear sets)
+    return lane, location, target_level, do_this, why_bullets, list(prep[:2])
 
 
 def get_next_strategy(profile: Profile, path_id: str = "fast_xp") -> NextStrategyResponse:
@@ -81,49 +306,16 @@ def get_next_strategy(profile: Profile, path_id: str = "fast_xp") -> NextStrateg
     strength = profile.skills.get("strength", 1)
     ranged = profile.skills.get("ranged", 1)
     magic = profile.skills.get("magic", 1)
-    combat_level = calculate_combat_level(profile.skills)
-    total_level = sum(profile.skills.values())
+    combat_level = profile.combat_level
+    total_level = profile.total_level
     
     # Path-specific logic
     if path_id == "quest_progression":
-        # Quest-focused advice
-        if total_level < 300:
-            do_this = "Complete Waterfall Quest for instant 13,750 Attack and Strength XP"
-            why_bullets = [
-                "Waterfall Quest provides massive early combat XP with minimal requirements",
-                "Unlocks access to new areas and is a prerequisite for Recipe for Disaster"
-            ]
-            prep_bullets = ["Get 10 Agility (can be done at Gnome Stronghold)"]
-        elif total_level < 750:
-            if profile.membership == "p2p":
-                do_this = "Work toward Recipe for Disaster subquests to unlock Barrows Gloves"
-                why_bullets = [
-                    "Barrows Gloves are best-in-slot melee gloves for most builds",
-                    "Recipe for Disaster unlocks many other quests and content"
-                ]
-                prep_bullets = ["Complete prerequisite quests: Cook's Assistant, Goblin Diplomacy"]
-            else:
-                do_this = "Complete Dragon Slayer I for Rune Platebody and access to Elvarg"
-                why_bullets = [
-                    "Dragon Slayer unlocks a powerful F2P armor piece",
-                    "Engages with F2P bossing content"
-                ]
-                prep_bullets = ["Reach 32 Quest Points and complete required quests"]
-        else:
-            if profile.membership == "p2p":
-                do_this = "Focus on Grandmaster quests or quest cape for max rewards"
-                why_bullets = [
-                    "High-level quests unlock powerful items and areas",
-                    "Quest completion provides significant XP lamps and utility"
-                ]
-                prep_bullets = []
-            else:
-                do_this = "Complete all remaining F2P quests for quest points and rewards"
-                why_bullets = [
-                    "Maximizes F2P content completion",
-                    "Prepares for potential membership benefits"
-                ]
-                prep_bullets = []
+        # Quest-focused advice, banded by total level
+        band = _QUEST_BANDS[bisect_right(_QUEST_LEVELS, total_level)]
+        do_this, why, prep = band[profile.membership]
+        why_bullets = list(why)
+        prep_bullets = list(prep)
         
         # For quest path, use generic location
         location = "Quest locations"
@@ -131,275 +323,50 @@ def get_next_strategy(profile: Profile, path_id: str = "fast_xp") -> NextStrateg
         target_level = None
         
     elif path_id == "money_making":
-        # Money-making focused advice
-        if profile.membership == "f2p":
-            if combat_level < 30:
-                do_this = "Collect Cowhides in Lumbridge or mine Clay in Varrock"
-                why_bullets = [
-                    "Low requirements, consistent income",
-                    "Funds early gear and supplies"
-                ]
-                prep_bullets = []
-            else:
-                do_this = "Kill Hill Giants for Limpwurt Roots and Big Bones in Edgeville Dungeon"
-                why_bullets = [
-                    "Good F2P combat XP and drops",
-                    "Consistent GP for mid-level F2P players"
-                ]
-                prep_bullets = []
-        else:  # P2P
-            if combat_level < 60:
-                do_this = "Collect Snape Grass on Waterbirth Island or do early Slayer tasks"
-                why_bullets = [
-                    "Low-level P2P money maker",
-                    "Slayer provides combat XP and drops"
-                ]
-                prep_bullets = []
-            else:
-                do_this = "Farm herbs, do high-level Slayer, or run Barrows"
-                why_bullets = [
-                    "High-profit methods for mid-to-high level players",
-                    "Funds expensive gear and supplies"
-                ]
-                prep_bullets = []
+        # Money-making focused advice, banded by combat level per membership
+        threshold, bands = _MONEY_BANDS[profile.membership]
+        do_this, why = bands[combat_level >= threshold]
+        why_bullets = list(why)
+        prep_bullets = []
         
         location = "Money-making locations"
         lane = "money"
         target_level = None
         
     else:  # fast_xp (default)
-        # Determine lane by lowest combat stat
-        # Melee = average of Attack and Strength
-        melee_avg = (attack + strength) / 2
-        lane_stats = {
-            "melee": melee_avg,
-            "ranged": ranged,
-            "magic": magic
-        }
-        
-        # Find the lane with the lowest stat
-        lowest_lane = min(lane_stats.items(), key=lambda x: x[1])
-        lane = lowest_lane[0]
-        lane_level = int(lowest_lane[1])
-        
-        # Determine target level and training spot based on lane and current level
-        if lane == "melee":
-            # Use the lower of Attack or Strength for recommendations
-            primary_stat = min(attack, strength)
-            stat_name = "Attack" if attack <= strength else "Strength"
-            
-            if primary_stat < 20:
-                target_level = 20
-                location = "Al Kharid Warriors" if profile.membership == "f2p" else "Lumbridge Cows"
-                gear = "using a scimitar"
-                primary_location = location
-                why_bullets = [
-                    f"Reaching 20 {stat_name} unlocks better weapons and faster training",
-                    "Scimitar is the fastest weapon type for melee XP"
-                ]
-                stop_doing = None
-            elif primary_stat < 40:
-                target_level = 40
-                if profile.membership == "p2p":
-                    location = "Rock Crabs"
-                    gear = "using a scimitar"
-                else:
-                    location = "Al Kharid Warriors"
-                    gear = "using a scimitar"
-                why_bullets = [
-                    f"Your melee stats ({attack} Attack, {strength} Strength) are your lowest combat stats",
-                    f"Reaching 40 {stat_name} unlocks better training spots and gear"
-                ]
-                stop_doing = None
-            elif primary_stat < 60:
-                target_level = 60
-                if profile.membership == "p2p":
-                    location = "Sand Crabs"
-                    gear = "using a scimitar"
-                else:
-                    location = "Hill Giants"
-                    gear = "using a scimitar"
-                why_bullets = [
-                    f"Your melee stats ({attack} Attack, {strength} Strength) are your lowest combat stats",
-                    f"Reaching 60 {stat_name} unlocks mid-game training methods"
-                ]
-                stop_doing = None
-            else:
-                target_level = min(primary_stat + 10, 99)
-                if profile.membership == "p2p":
-                    location = "Sand Crabs" if primary_stat < 70 else "Nightmare Zone"
-                    gear = "using a scimitar"
-                else:
-                    location = "Hill Giants"
-                    gear = "using a scimitar"
-                why_bullets = [
-                    f"Your melee stats ({attack} Attack, {strength} Strength) are your lowest combat stats",
-                    f"Balancing combat stats improves overall account progression"
-                ]
-                stop_doing = None
-            
-            do_this = f"Train {stat_name} to {target_level} at {location} {gear}"
-            
-        elif lane == "ranged":
-            if ranged < 20:
-                target_level = 20
-                location = "Lumbridge Cows"
-                gear = "using a shortbow"
-                why_bullets = [
-                    "Ranged is your lowest combat stat and unlocks safe training methods",
-                    "Shortbow is the fastest early-game ranged weapon"
-                ]
-                stop_doing = None
-            elif ranged < 40:
-                target_level = 40
-                if profile.membership == "p2p":
-                    location = "Rock Crabs"
-                else:
-                    location = "Al Kharid Warriors"
-                gear = "using a shortbow"
-                why_bullets = [
-                    f"Ranged ({ranged}) is your lowest combat stat",
-                    f"Reaching 40 Ranged unlocks better training spots and gear"
-                ]
-                stop_doing = None
-            elif ranged < 60:
-                target_level = 60
-                if profile.membership == "p2p":
-                    location = "Sand Crabs"
-                else:
-                    location = "Hill Giants"
-                gear = "using a shortbow"
-                why_bullets = [
-                    f"Ranged ({ranged}) is your lowest combat stat",
-                    f"Reaching 60 Ranged unlocks mid-game training methods"
-                ]
-                stop_doing = None
-            else:
-                target_level = min(ranged + 10, 99)
-                if profile.membership == "p2p":
-                    location = "Sand Crabs" if ranged < 70 else "Nightmare Zone"
-                else:
-                    location = "Hill Giants"
-                gear = "using a shortbow"
-                why_bullets = [
-                    f"Ranged ({ranged}) is your lowest combat stat",
-                    "Balancing combat stats improves overall account progression"
-                ]
-                stop_doing = None
-            
-            do_this = f"Train Ranged to {target_level} on {location} {gear}"
-            
-        else:  # magic
-            if magic < 20:
-                target_level = 20
-                location = "Chickens (Lumbridge)"
-                gear = "using Wind Strike"
-                why_bullets = [
-                    "Magic is your lowest combat stat and unlocks utility spells",
-                    "Wind Strike is the fastest early-game magic training method"
-                ]
-                stop_doing = None
-            elif magic < 40:
-                target_level = 40
-                if profile.membership == "p2p":
-                    location = "Rock Crabs"
-                else:
-                    location = "Al Kharid Warriors"
-                gear = "using Fire Strike"
-                why_bullets = [
-                    f"Magic ({magic}) is your lowest combat stat",
-                    f"Reaching 40 Magic unlocks better spells and training methods"
-                ]
-                stop_doing = None
-            elif magic < 60:
-                target_level = 60
-                if profile.membership == "p2p":
-                    location = "Sand Crabs"
-                else:
-                    location = "Hill Giants"
-                gear = "using Fire Bolt"
-                why_bullets = [
-                    f"Magic ({magic}) is your lowest combat stat",
-                    f"Reaching 60 Magic unlocks mid-game training methods"
-                ]
-                stop_doing = None
-            else:
-                target_level = min(magic + 10, 99)
-                if profile.membership == "p2p":
-                    location = "Sand Crabs" if magic < 70 else "Nightmare Zone"
-                else:
-                    location = "Hill Giants"
-                gear = "using Fire Bolt"
-                why_bullets = [
-                    f"Magic ({magic}) is your lowest combat stat",
-                    "Balancing combat stats improves overall account progression"
-                ]
-                stop_doing = None
-            
-            do_this = f"Train Magic to {target_level} {gear} on {location}"
-        
-        # Determine prep bullets for fast_xp path (only things required to start, max 2, no gear sets)
-        prep_bullets = []
-        if lane == "melee":
-            if primary_stat < 20:
-                prep_bullets = ["Get a scimitar (buy from Varrock or Al Kharid)"]
-            else:
-                # Only mention if it's a significant upgrade or required
-                prep_bullets = []
-        elif lane == "ranged":
-            if ranged < 20:
-                prep_bullets = ["Get a shortbow and arrows"]
-            else:
-                prep_bullets = []
-        else:  # magic
-            if magic < 20:
-                prep_bullets = ["Get runes: air and mind"]
-            elif magic < 40:
-                prep_bullets = ["Get runes: fire and mind"]
-            else:
-                prep_bullets = ["Get runes: fire and chaos"]
-        
-        # Limit prep bullets to 2
-        prep_bullets = prep_bullets[:2]
-    
-    # Build response
-    primary_card = AdviceCard(
-        title=path_id.replace("_", " ").title() if path_id != "fast_xp" else f"Train {lane.capitalize()}",
-        do_this_next=do_this
-    )
-    
-    why_card = AdviceCard(
-        title="Why this is best",
-        bullets=why_bullets[:2]  # Max 2 bullets
-    )
+        lane, location, target_level, do_this, why_bullets, prep_bullets = _fast_xp_advice(
+            profile.membership, attack, strength, ranged, magic
+        )
     
     # For quest and money paths, skip alternates
     alternates = None
-    if path_id == "fast_xp" and 'target_level' in locals() and target_level is not None:
-        # Extract primary location name for spot rotation
-        primary_location = location
-        
-        # Get alternate spots
+    if path_id == "fast_xp":
+        # Get alternate spots around the primary location
         alternates_data = get_alternate_spots(
-            primary_spot=primary_location,
+            primary_spot=location,
             membership=profile.membership,
             style=lane,
             target_level=target_level,
             max_alternates=4
         )
         
-        # Convert to AlternateSpot objects
-        alternates = [AlternateSpot(**alt) for alt in alternates_data] if alternates_data else None
+        # Spots come back as prevalidated AlternateSpot models
+        alternates = list(alternates_data) if alternates_data else None
     
-    # Build response - conditionally include prep
-    primary_card_with_alternates = AdviceCard(
-        title=primary_card.title,
+    # Build response (inputs are trusted internal data, so skip validation)
+    primary_card = AdviceCard.model_construct(
+        title=path_id.replace("_", " ").title() if path_id != "fast_xp" else f"Train {lane.capitalize()}",
         do_this_next=do_this,
         alternates=alternates
     )
     
+    why_card = AdviceCard.model_construct(
+        title="Why this is best",
+        bullets=why_bullets[:2]  # Max 2 bullets
+    )
+    
     response_data = {
-        "primary": primary_card_with_alternates,
+        "primary": primary_card,
         "why": why_card
     }
     
@@ -407,7 +374,7 @@ def get_next_strategy(profile: Profile, path_id: str = "fast_xp") -> NextStrateg
     # Remove prep if do_this_next is falsy AND bullets is empty/None
     prep_has_bullets = prep_bullets and len(prep_bullets) > 0
     if prep_has_bullets:
-        prep_card = AdviceCard(
+        prep_card = AdviceCard.model_construct(
             title="Prep (optional)",
             bullets=prep_bullets
         )
@@ -416,22 +383,131 @@ def get_next_strategy(profile: Profile, path_id: str = "fast_xp") -> NextStrateg
     return NextStrategyResponse(**response_data)
 
 
-@app.get("/advice/next", response_model=NextStrategyResponse)
-async def get_next_advice(path_id: str = None):
+@app.get("/advice/next", response_model=NextStrategyResponse, response_model_exclude_none=True)
+def get_next_advice(path_id: str = None):
     """Get a single next strategy card for the home screen
     
     Args:
         path_id: Optional path ID (fast_xp, quest_progression, money_making).
                  If not provided, uses the backend's recommended path.
     """
-    profile = get_profile()
+    fingerprint = _profile_fingerprint(get_profile())
     
     # If no path_id provided, determine recommended path
     if path_id is None:
-        options_response = get_advice_options(profile)
+        options_response = _coalesced(("options", fingerprint), lambda: _cached_advice_options(fingerprint))
         path_id = options_response.recommended_id
     
-    return get_next_strategy(profile, path_id)
+    return _coalesced(("next", fingerprint, path_id), lambda: _cached_next_strategy(fingerprint, path_id))
+
+
+def _profile_fingerprint(profile: Profile) -> Tuple[str, Tuple[Tuple[str, int], ...]]:
+    """Hashable key for the profile fields the advice cards depend on (membership, skills)"""
+    return profile.membership, tuple(sorted(profile.skills.items()))
+
+
+def _profile_from_fingerprint(fingerprint: Tuple[str, Tuple[Tuple[str, int], ...]]) -> Profile:
+    """Rebuild a minimal Profile carrying only the fingerprinted fields"""
+    membership, skills_key = fingerprint
+    return Profile(membership=membership, skills=dict(skills_key))
+
+
+# Keyed on profile content, so a saved profile change is simply a new key.
+# Cached responses are shared between requests and must not be mutated.
+@lru_cache(maxsize=512)
+def _cached_next_strategy(fingerprint, path_id: str) -> NextStrategyResponse:
+    return get_next_strategy(_profile_from_fingerprint(fingerprint), path_id)
+
+
+@lru_cache(maxsize=512)
+def _cached_advice_options(fingerprint) -> AdviceOptionsResponse:
+    return get_advice_options(_profile_from_fingerprint(fingerprint))
+
+
+# Constant option cards for get_advice_options, keyed by (membership, combat >= 50)
+# and total level >= 500. The fast_xp first bullet is a {combat_level} template.
+_FAST_XP_LOW = dict(
+    id="fast_xp",
+    title="Fast Combat XP",
+    summary="Focus on combat training to quickly level up and unlock better content.",
+    why_bullets=[
+        "Your combat level ({combat_level}) is below 50, limiting access to mid-game content.",
+        "Combat training unlocks better training spots, quests, and gear upgrades."
+    ],
+    tags=["combat"]
+)
+_FAST_XP_HIGH = dict(
+    id="fast_xp",
+    title="Efficient Combat Training",
+    summary="Optimize your combat training for maximum XP rates and unlocks.",
+    why_bullets=[
+        "At {combat_level} combat, you can access high-efficiency training methods.",
+        "Focusing on combat unlocks end-game content and better money-making opportunities."
+    ],
+    tags=["combat"]
+)
+_FAST_XP_OPTIONS = {
+    ("f2p", False): AdviceOption(**_FAST_XP_LOW, do_this_next="Train at Al Kharid Warriors to reach 50+ combat."),
+    ("p2p", False): AdviceOption(**_FAST_XP_LOW, do_this_next="Train at Sand Crabs to reach 50+ combat."),
+    ("f2p", True): AdviceOption(**_FAST_XP_HIGH, do_this_next="Train at Hill Giants for efficient AFK training."),
+    ("p2p", True): AdviceOption(**_FAST_XP_HIGH, do_this_next="Train at Nightmare Zone for efficient AFK training."),
+}
+
+_QUEST_OPTIONS = (
+    AdviceOption(
+        id="quest_progression",
+        title="Quest Progression",
+        summary="Complete key quests to unlock essential content and quality-of-life improvements.",
+        do_this_next="Complete Waterfall Quest for instant combat XP, then work toward Recipe for Disaster subquests.",
+        why_bullets=[
+            "Quests provide massive XP rewards and unlock essential content like Barrows Gloves.",
+            "Early quest completion saves hours of grinding and opens up better training methods."
+        ],
+        tags=["quest"]
+    ),
+    AdviceOption(
+        id="quest_progression",
+        title="Quest Completion",
+        summary="Finish remaining quests to unlock end-game content and quality-of-life features.",
+        do_this_next="Complete Recipe for Disaster for Barrows Gloves, then work on achievement diaries.",
+        why_bullets=[
+            "High-level quests unlock essential gear (Barrows Gloves) and access to new areas.",
+            "Quest completion is required for many end-game activities and money-making methods."
+        ],
+        tags=["quest"]
+    ),
+)
+
+_P2P_MONEY = dict(
+    id="money_making",
+    title="Build Your Bank",
+    summary="Earn GP to fund gear upgrades and quality-of-life items for smoother progression.",
+    why_bullets=[
+        "Having GP allows you to buy convenience items and better gear without grinding.",
+        "Early money-making sets you up for efficient training and quest completion later."
+    ],
+    tags=["money"]
+)
+_F2P_MONEY = AdviceOption(
+    id="money_making",
+    title="F2P Money Making",
+    summary="Earn GP in free-to-play to prepare for membership or buy essential items.",
+    do_this_next="Mine iron ore or fish lobsters to build your bank before upgrading to membership.",
+    why_bullets=[
+        "F2P money-making helps you start membership with a solid financial foundation.",
+        "Having GP ready makes membership more efficient and enjoyable."
+    ],
+    tags=["money"]
+)
+_MONEY_OPTIONS = {
+    ("f2p", False): _F2P_MONEY,
+    ("f2p", True): _F2P_MONEY,
+    ("p2p", False): AdviceOption(
+        **_P2P_MONEY,
+        do_this_next="Start with low-level money makers like fishing or woodcutting to build initial capital."
+    ),
+    ("p2p", True): AdviceOption(**_P2P_MONEY, do_this_next="Start with Slayer tasks to build initial capital."),
+}
 
 
 def get_advice_options(profile: Profile) -> AdviceOptionsResponse:
@@ -441,88 +517,19 @@ def get_advice_options(profile: Profile) -> AdviceOptionsResponse:
     defence = profile.skills.get("defence", 1)
     ranged = profile.skills.get("ranged", 1)
     magic = profile.skills.get("magic", 1)
-    combat_level = calculate_combat_level(profile.skills)
-    total_level = sum(profile.skills.values())
-    
-    options = []
-    
-    # Option 1: Fast XP (combat training)
-    if combat_level < 50:
-        options.append(AdviceOption(
-            id="fast_xp",
-            title="Fast Combat XP",
-            summary="Focus on combat training to quickly level up and unlock better content.",
-            do_this_next=f"Train at {'Sand Crabs' if profile.membership == 'p2p' else 'Al Kharid Warriors'} to reach 50+ combat.",
-            why_bullets=[
-                f"Your combat level ({combat_level}) is below 50, limiting access to mid-game content.",
-                "Combat training unlocks better training spots, quests, and gear upgrades."
-            ],
-            tags=["combat"]
-        ))
-    else:
-        options.append(AdviceOption(
-            id="fast_xp",
-            title="Efficient Combat Training",
-            summary="Optimize your combat training for maximum XP rates and unlocks.",
-            do_this_next=f"Train at {'Nightmare Zone' if profile.membership == 'p2p' else 'Hill Giants'} for efficient AFK training.",
-            why_bullets=[
-                f"At {combat_level} combat, you can access high-efficiency training methods.",
-                "Focusing on combat unlocks end-game content and better money-making opportunities."
-            ],
-            tags=["combat"]
-        ))
-    
-    # Option 2: Quest Progression
-    if total_level < 500:
-        options.append(AdviceOption(
-            id="quest_progression",
-            title="Quest Progression",
-            summary="Complete key quests to unlock essential content and quality-of-life improvements.",
-            do_this_next="Complete Waterfall Quest for instant combat XP, then work toward Recipe for Disaster subquests.",
-            why_bullets=[
-                "Quests provide massive XP rewards and unlock essential content like Barrows Gloves.",
-                "Early quest completion saves hours of grinding and opens up better training methods."
-            ],
-            tags=["quest"]
-        ))
-    else:
-        options.append(AdviceOption(
-            id="quest_progression",
-            title="Quest Completion",
-            summary="Finish remaining quests to unlock end-game content and quality-of-life features.",
-            do_this_next="Complete Recipe for Disaster for Barrows Gloves, then work on achievement diaries.",
-            why_bullets=[
-                "High-level quests unlock essential gear (Barrows Gloves) and access to new areas.",
-                "Quest completion is required for many end-game activities and money-making methods."
-            ],
-            tags=["quest"]
-        ))
+    combat_level = profile.combat_level
+    total_level = profile.total_level
     
-    # Option 3: Money Making / GP
-    if profile.membership == "p2p":
-        options.append(AdviceOption(
-            id="money_making",
-            title="Build Your Bank",
-            summary="Earn GP to fund gear upgrades and quality-of-life items for smoother progression.",
-            do_this_next=f"Start with {'Slayer tasks' if combat_level >= 50 else 'low-level money makers like fishing or woodcutting'} to build initial capital.",
-            why_bullets=[
-                "Having GP allows you to buy convenience items and better gear without grinding.",
-                "Early money-making sets you up for efficient training and quest completion later."
-            ],
-            tags=["money"]
-        ))
-    else:
-        options.append(AdviceOption(
-            id="money_making",
-            title="F2P Money Making",
-            summary="Earn GP in free-to-play to prepare for membership or buy essential items.",
-            do_this_next="Mine iron ore or fish lobsters to build your bank before upgrading to membership.",
-            why_bullets=[
-                "F2P money-making helps you start membership with a solid financial foundation.",
-                "Having GP ready makes membership more efficient and enjoyable."
-            ],
-            tags=["money"]
-        ))
+    # Static option cards; only the fast_xp combat-level bullet is filled in per call
+    high_combat = combat_level >= 50
+    fast_xp = _FAST_XP_OPTIONS[(profile.membership, high_combat)]
+    options = [
+        fast_xp.model_copy(update={
+            "why_bullets": [fast_xp.why_bullets[0].format(combat_level=combat_level), *fast_xp.why_bullets[1:]]
+        }),
+        _QUEST_OPTIONS[total_level >= 500],
+        _MONEY_OPTIONS[(profile.membership, high_combat)],
+    ]
     
     # Determine recommended_id based on player state
     if combat_level < 30:
@@ -538,36 +545,58 @@ def get_advice_options(profile: Profile) -> AdviceOptionsResponse:
     )
 
 
-@app.get("/advice/options", response_model=AdviceOptionsResponse)
-async def get_advice_options_endpoint():
+# Profile-derived responses: clients keep them but revalidate on every use
+_PROFILE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
+@app.get("/advice/options", response_model=AdviceOptionsResponse, response_model_exclude_none=True)
+def get_advice_options_endpoint(request: Request, response: Response):
     """Get 3 option cards for the player to choose from"""
-    profile = get_profile()
-    return get_advice_options(profile)
+    fingerprint = _profile_fingerprint(get_profile())
+    etag = _etag("options", fingerprint)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = _PROFILE_CACHE_CONTROL
+    return _coalesced(("options", fingerprint), lambda: _cached_advice_options(fingerprint))
 
 
 @app.get("/beginner-path", response_model=BeginnerPathResponse)
-async def get_beginner_path_endpoint():
+def get_beginner_path_endpoint(request: Request):
     """Get beginner power path cards based on the current stored profile"""
-    profile = get_profile()
-    combat_level = calculate_combat_level(profile.skills)
-    total_level = sum(profile.skills.values())
-    
-    # Check if beginner
-    if not is_beginner_player(combat_level, total_level):
-        return BeginnerPathResponse(cards=[], current_index=0)
-    
-    cards = get_beginner_cards(profile, combat_level)
-    return BeginnerPathResponse(cards=cards, current_index=0)
+    etag, body = _BEGINNER_PATHS[_beginner_path_key(get_profile())]
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": _PROFILE_CACHE_CONTROL}
+    )
+
+
+def _beginner_path_key(profile: Profile) -> Optional[Tuple[str, bool]]:
+    """
+    The only profile state get_beginner_cards() branches on: membership and
+    whether the stat-balancing card applies. None for non-beginners.
+    """
+    if not is_beginner_player(profile.combat_level, profile.total_level):
+        return None
+    skills = profile.skills
+    attack = skills.get("attack", 1)
+    strength = skills.get("strength", 1)
+    if profile.membership == "p2p":
+        return "p2p", attack < 25 or strength < 25
+    return profile.membership, attack < 15 or strength < 15 or skills.get("defence", 1) < 15
 
 
 @app.get("/setup", response_model=PlayerSetup)
-async def get_setup_endpoint():
+def get_setup_endpoint():
     """Get the current player setup"""
     return get_setup()
 
 
 @app.put("/setup")
-async def update_setup_endpoint(setup: PlayerSetup):
+def update_setup_endpoint(setup: PlayerSetup):
     """Update and save the player setup"""
     try:
         save_setup(setup)
@@ -576,34 +605,38 @@ async def update_setup_endpoint(setup: PlayerSetup):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# OSRS display names: 1-12 letters, digits, spaces, hyphens or underscores
+_PLAYER_NAME_RE = re.compile(r"^[A-Za-z0-9 _-]{1,12}$")
+
+
 class HiscoresImportRequest(BaseModel):
     player_name: str
 
+    @field_validator("player_name")
+    @classmethod
+    def _normalize_player_name(cls, value: str) -> str:
+        """Strip the name and reject anything that can't be an OSRS name (422 before the handler runs)"""
+        value = value.strip()
+        if not _PLAYER_NAME_RE.match(value):
+            raise ValueError("Player name must be 1-12 letters, numbers, spaces, hyphens or underscores")
+        return value
+
 
 @app.post("/import/hiscores")
 async def import_hiscores(request: HiscoresImportRequest):
     """Import skills from OSRS hiscores for a player"""
-    if not request.player_name or not request.player_name.strip():
-        raise HTTPException(status_code=400, detail="Player name is required")
-    
     # Fetch hiscores
-    skills, error_message = fetch_hiscores(request.player_name)
+    skills, error_message = await fetch_hiscores(request.player_name)
     
     if skills is None:
         # Use the specific error message from fetch_hiscores
         error_detail = error_message or f"Player '{request.player_name}' not found in hiscores or error fetching data"
         raise HTTPException(status_code=404, detail=error_detail)
     
-    # Get current profile and update with hiscores data
+    # Update name and skills with hiscores data in a single write
     # DO NOT overwrite membership/game_mode/goals/playtime if already set
-    profile = get_profile()
-    profile.player_name = request.player_name.strip()
-    profile.skills = skills  # Replace skills with hiscores data
-    # Preserve: membership, game_mode, goals, playtime_minutes
-    
-    # Save updated profile
     try:
-        save_profile(profile)
+        await run_in_threadpool(update_profile_with_skills, request.player_name, skills)
         return {
             "message": f"Successfully imported hiscores for {request.player_name}",
             "skills_imported": len(skills)
@@ -618,99 +651,169 @@ class BuildsResponse(BaseModel):
     builds: List[BuildCard]
 
 
+# Static JSON data files
+_DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+_BUILDS_PATH = os.path.join(_DATA_DIR, "builds_v1.json")
+_ITEM_REQUIREMENTS_PATH = os.path.join(_DATA_DIR, "item_requirements_min.json")
+_RECIPES_PATH = os.path.join(_DATA_DIR, "recipes_v1.json")
+
+# Static JSON data, parsed once and shared across requests (treat as read-only)
+_BUILDS: Optional[Dict] = None
+_RECIPES: Optional[Dict] = None
+_ITEM_REQUIREMENTS: Optional[Dict] = None
+
+
 def load_builds():
-    """Load builds data"""
-    builds_path = os.path.join(os.path.dirname(__file__), "data", "builds_v1.json")
-    try:
-        with open(builds_path, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[BUILDS WARNING] Failed to load builds: {e}")
-        return {"builds": []}
+    """Load builds data (cached after first load)"""
+    global _BUILDS
+    if _BUILDS is None:
+        try:
+            with open(_BUILDS_PATH, 'rb') as f:
+                _BUILDS = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
+            logger.warning("Failed to load builds: %s", e)
+            _BUILDS = {"builds": []}
+    return _BUILDS
+
+
+# Mixed into every ETag derived from inputs rather than the body; bump it when a
+# code change alters what the same inputs render to
+_ETAG_VERSION = "1"
+
+
+def _weak_etag(data: bytes) -> str:
+    """Weak ETag hashed from data"""
+    # Weak because GZipMiddleware sends the same tag on gzip and identity bodies,
+    # which are equivalent but not byte-identical
+    return 'W/"' + hashlib.blake2b(data, digest_size=8).hexdigest() + '"'
+
+
+def _etag(*parts) -> str:
+    """ETag value hashed from JSON-serializable parts (stable across restarts and workers)"""
+    return _weak_etag(orjson.dumps((_ETAG_VERSION, parts)))
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """True if the client's cached copy (If-None-Match) is still current"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # A list of tags; If-None-Match uses weak comparison, so W/ is ignored
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def _encode_beginner_path(path: BeginnerPathResponse) -> Tuple[str, bytes]:
+    """(ETag, encoded body) for a prebuilt beginner path response"""
+    body = orjson.dumps(path.model_dump())
+    return _weak_etag(body), body
+
+
+# Every possible /beginner-path response, keyed by _beginner_path_key() so
+# requests are a dict lookup with nothing to build or serialize
+_BEGINNER_PATHS: Dict[Optional[Tuple[str, bool]], Tuple[str, bytes]] = {
+    None: _encode_beginner_path(BeginnerPathResponse(cards=[], current_index=0))
+}
+for _membership in ("f2p", "p2p"):
+    for _needs_training in (True, False):
+        _level = 1 if _needs_training else 99
+        _sample = Profile(membership=_membership, skills={"attack": _level, "strength": _level, "defence": _level})
+        _BEGINNER_PATHS[(_membership, _needs_training)] = _encode_beginner_path(BeginnerPathResponse(
+            cards=get_beginner_cards(_sample, _sample.combat_level), current_index=0
+        ))
+
+# Builds only change on deploy; combined with profile state per request
+_BUILDS_ETAG = _etag(load_builds())
+
+# Builds grouped by context for O(1) /builds?context= lookups
+_BUILDS_BY_CONTEXT: Dict[str, List[Dict]] = {}
+for _build in load_builds().get("builds", []):
+    _BUILDS_BY_CONTEXT.setdefault(_build.get("context"), []).append(_build)
 
 
 def load_item_requirements() -> Dict:
-    """Load item requirements"""
-    requirements_path = os.path.join(os.path.dirname(__file__), "data", "item_requirements_min.json")
-    try:
-        with open(requirements_path, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[BUILDS WARNING] Failed to load item requirements: {e}")
-        return {}
+    """Load item requirements (cached after first load)"""
+    global _ITEM_REQUIREMENTS
+    if _ITEM_REQUIREMENTS is None:
+        try:
+            with open(_ITEM_REQUIREMENTS_PATH, 'rb') as f:
+                _ITEM_REQUIREMENTS = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
+            logger.warning("Failed to load item requirements: %s", e)
+            _ITEM_REQUIREMENTS = {}
+    return _ITEM_REQUIREMENTS
+
+
+# Load at import so the first /builds request doesn't pay for it
+load_item_requirements()
+
+
+# Requirements preprocessed once: item -> ((lowercase skill, min level), ...)
+_REQUIREMENT_PAIRS: Dict[str, Tuple[Tuple[str, int], ...]] = {
+    item: tuple((skill.lower(), min_level) for skill, min_level in reqs.items())
+    for item, reqs in load_item_requirements().items()
+}
+
+# Fallback weapons in preference order (only those with known requirements)
+_FALLBACK_WEAPONS = tuple(
+    (weapon, _REQUIREMENT_PAIRS[weapon])
+    for weapon in ("Scythe of Vitur", "Dharok's Greataxe", "Abyssal Whip", "Dragon Scimitar")
+    if weapon in _REQUIREMENT_PAIRS
+)
+
 
+def _meets(pairs: Tuple[Tuple[str, int], ...], skills: Dict[str, int]) -> bool:
+    """Check preprocessed (skill, min level) pairs against player skills"""
+    return all(skills.get(skill, 1) >= min_level for skill, min_level in pairs)
 
-def meets_requirements(item_name: str, requirements: Dict, skills: Dict[str, int]) -> bool:
+
+def meets_requirements(item_name: str, skills: Dict[str, int]) -> bool:
     """Check if player skills meet item requirements"""
-    item_reqs = requirements.get(item_name, {})
-    if not item_reqs:
-        return True  # No requirements = always eligible
-    
-    for skill, min_level in item_reqs.items():
-        player_level = skills.get(skill.lower(), 1)
-        if player_level < min_level:
-            return False
-    return True
+    # No requirements = always eligible
+    return _meets(_REQUIREMENT_PAIRS.get(item_name, ()), skills)
 
 
-def get_fallback_weapon(requirements: Dict, skills: Dict[str, int], membership: str) -> Optional[str]:
+def get_fallback_weapon(skills: Dict[str, int], membership: str) -> Optional[str]:
     """Get best eligible fallback weapon from ordered list"""
-    fallback_order = [
-        "Scythe of Vitur",
-        "Dharok's Greataxe",
-        "Abyssal Whip",
-        "Dragon Scimitar"
-    ]
-    
-    for weapon in fallback_order:
-        if meets_requirements(weapon, requirements, skills):
-            # Check if weapon exists in requirements (basic validation)
-            if weapon in requirements:
-                return weapon
-    return None
+    return next((weapon for weapon, pairs in _FALLBACK_WEAPONS if _meets(pairs, skills)), None)
 
 
-def filter_weapon_by_requirements(gear: List[str], requirements: Dict, skills: Dict[str, int], membership: str) -> tuple[List[str], Optional[str]]:
+def filter_weapon_by_requirements(gear: List[str], skills: Dict[str, int], membership: str) -> tuple[List[str], Optional[str]]:
     """
     Filter first weapon in gear list based on requirements.
-    Only replaces gear[0] (weapon), keeps all other items unchanged.
+    Only replaces gear[0] (weapon), keeps all other items unchanged, so the
+    returned list always has the same length as the input.
     Returns: (filtered_gear, downgrade_note)
     """
     if not gear:
         return gear, None
     
-    # Preserve original length - only modify first item
-    original_length = len(gear)
-    
     # Assume first item is weapon (as per requirements)
     first_item = gear[0]
     
     # Check if first item has requirements
-    if first_item not in requirements:
+    pairs = _REQUIREMENT_PAIRS.get(first_item)
+    if pairs is None:
         # No requirements, keep as-is
         return gear, None
     
     # Check if player meets requirements
-    if meets_requirements(first_item, requirements, skills):
+    if _meets(pairs, skills):
         return gear, None
     
     # Player doesn't meet requirements, find fallback
-    fallback = get_fallback_weapon(requirements, skills, membership)
+    fallback = get_fallback_weapon(skills, membership)
     if not fallback:
         # No eligible fallback, keep original (will show but player can't use)
         return gear, None
     
     # Replace ONLY gear[0] with fallback, keep rest unchanged
-    new_gear = [fallback] + gear[1:]
-    
-    # Verify length preserved
-    if len(new_gear) != original_length:
-        print(f"[BUILDS WARNING] Gear list length changed from {original_length} to {len(new_gear)}")
-        # Fallback: return original to prevent data loss
-        return gear, None
+    new_gear = [fallback, *gear[1:]]
     
     # Build downgrade note
-    reqs = requirements.get(first_item, {})
+    reqs = load_item_requirements().get(first_item, {})
     req_parts = [f"{reqs[k]} {k.capitalize()}" for k in sorted(reqs.keys())]
     req_str = " / ".join(req_parts)
     note = f"Weapon adjusted based on your stats (requires {req_str})."
@@ -718,253 +821,349 @@ def filter_weapon_by_requirements(gear: List[str], requirements: Dict, skills: D
     return new_gear, note
 
 
+def _build_static_card(build: Dict) -> BuildCard:
+    """Validate tier rules (warn only, don't remove items) and construct the card once"""
+    to_validate = [
+        (gear_option["gear"], gear_option["id"])
+        for gear_option in build.get("gear_options", [])
+        if gear_option.get("gear") and gear_option.get("id")
+    ]
+    for (gear, tier), (is_valid, error_msg) in zip(to_validate, validate_gear_tiers_batch(to_validate)):
+        if not is_valid:
+            logger.warning(
+                "Build '%s' tier '%s' validation failed: %s (tier rules: %s; gear kept as-is: %s)",
+                build.get('name', 'Unknown'), tier, error_msg, get_tier_description(tier), gear
+            )
+    return BuildCard(**build)
+
+
+# Non-nmz_melee builds don't depend on the profile, so their cards are built once
+# (keyed by id() of the cached build dict, which lives for the whole process)
+_STATIC_BUILD_CARDS: Dict[int, BuildCard] = {
+    id(_build): _build_static_card(_build)
+    for _build in load_builds().get("builds", [])
+    if _build.get("context") != "nmz_melee"
+}
+
+
+# Requirement sets that decide nmz_melee weapon filtering: each gear option's
+# weapon plus the fallbacks. Two profiles that meet the same subset get the same card.
+_BUILD_WEAPON_PAIRS = tuple(dict.fromkeys(
+    [
+        _REQUIREMENT_PAIRS[gear_option["gear"][0]]
+        for _build in load_builds().get("builds", [])
+        if _build.get("context") == "nmz_melee"
+        for gear_option in _build.get("gear_options", [])
+        if gear_option.get("gear") and gear_option["gear"][0] in _REQUIREMENT_PAIRS
+    ] + [pairs for _, pairs in _FALLBACK_WEAPONS]
+))
+
+# Validated cards for the profile-dependent builds as loaded; per-profile cards
+# are copies with the filtered gear and notes swapped in
+_BUILD_PROTOTYPES: Dict[int, BuildCard] = {
+    id(_build): BuildCard(**_build)
+    for _build in load_builds().get("builds", [])
+    if id(_build) not in _STATIC_BUILD_CARDS
+}
+
+# Profile-dependent cards by (id() of the cached build dict, weapon eligibility)
+_PROFILE_BUILD_CARDS: Dict[Tuple[int, Tuple[bool, ...]], BuildCard] = {}
+
+
+def _profile_build_card(build: Dict, profile: Profile) -> BuildCard:
+    """Card for a profile-dependent build, memoized on which weapon requirements the profile meets"""
+    key = (id(build), tuple(_meets(pairs, profile.skills) for pairs in _BUILD_WEAPON_PAIRS))
+    card = _PROFILE_BUILD_CARDS.get(key)
+    if card is None:
+        card = _PROFILE_BUILD_CARDS[key] = _build_profile_card(build, profile.skills, profile.membership)
+    return card
+
+
+def _build_profile_card(build: Dict, skills: Dict[str, int], membership: str) -> BuildCard:
+    """Filter weapons by the player's stats (nmz_melee) and construct the card"""
+    build_copy = build.copy()
+    # Copy the parts mutated below; the loaded builds are shared across requests
+    build_copy["gear_options"] = [option.copy() for option in build.get("gear_options", [])]
+    build_copy["notes"] = list(build.get("notes", []))
+    
+    # Keep original gear from JSON - do NOT auto-construct
+    # Only apply weapon filtering for nmz_melee (other builds are prebuilt)
+    if build_copy.get("context") == "nmz_melee":
+        gear_options = build_copy.get("gear_options", [])
+        weapon_downgraded = False
+        to_validate = []
+        
+        for gear_option in gear_options:
+            gear = gear_option.get("gear", [])
+            if not gear:
+                continue
+            
+            # Filter weapon (only gear[0]) - this preserves all other items
+            filtered_gear, note = filter_weapon_by_requirements(
+                gear, skills, membership
+            )
+            gear_option["gear"] = filtered_gear
+            if note:
+                weapon_downgraded = True
+            
+            tier = gear_option.get("id", "")
+            if tier:
+                to_validate.append((filtered_gear, tier))
+        
+        # Validate tier rules for all options at once, but don't remove items
+        validation_warnings = []
+        for (gear, tier), (is_valid, error_msg) in zip(to_validate, validate_gear_tiers_batch(to_validate)):
+            if not is_valid:
+                validation_warnings.append(f"Tier '{tier}': {error_msg}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Build '%s' tier '%s' validation failed: %s (tier rules: %s; gear kept as-is: %s)",
+                        build.get('name', 'Unknown'), tier, error_msg, get_tier_description(tier), gear
+                    )
+        
+        # Add notes if needed (skipping any the build already has)
+        if weapon_downgraded or validation_warnings:
+            notes = build_copy["notes"]
+            existing_notes = set(notes)
+            
+            for needed, note_text in (
+                (weapon_downgraded, "Weapon adjusted based on your stats."),
+                (validation_warnings, "Some items may require higher stats or violate tier rules."),
+            ):
+                if needed and note_text not in existing_notes:
+                    notes.append(note_text)
+                    existing_notes.add(note_text)
+    
+    return _BUILD_PROTOTYPES[id(build)].model_copy(update={
+        "gear_options": build_copy["gear_options"],
+        "notes": build_copy["notes"]
+    })
+
+
 @app.get("/builds", response_model=BuildsResponse)
-async def get_builds(context: Optional[str] = Query(None, description="Filter builds by context (e.g., 'nmz_melee', 'general_melee')")):
+def get_builds(
+    request: Request,
+    context: Optional[str] = Query(None, description="Filter builds by context (e.g., 'nmz_melee', 'general_melee')")
+):
     """Get build cards for specified context"""
-    builds_data = load_builds()
-    all_builds = builds_data.get("builds", [])
-    
     # Get profile and setup to determine default_gear_option_id
-    profile = get_profile()
-    setup = get_setup()
+    profile, setup = get_profile_and_setup()
     
+    # Cards depend on the profile (weapon filtering, default option), so the
+    # ETag covers it and clients must revalidate on every use
+    etag = _etag(_BUILDS_ETAG, context, profile.game_mode, profile.membership, profile.skills, setup.effort)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    builds_response = _coalesced(
+        ("builds", id(profile), id(setup), context),
+        lambda: _build_cards_response(profile, setup, context)
+    )
+    # Encode once with orjson and send with a Content-Length
+    return Response(
+        content=orjson.dumps(builds_response.model_dump()),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": _PROFILE_CACHE_CONTROL}
+    )
+
+
+def _build_cards_response(profile: Profile, setup: PlayerSetup, context: Optional[str]) -> BuildsResponse:
+    """Build the /builds response for a profile, setup and optional context"""
     # Filter by context if provided
     if context:
-        filtered_builds = [b for b in all_builds if b.get("context") == context]
+        filtered_builds = _BUILDS_BY_CONTEXT.get(context)
         if not filtered_builds:
             raise HTTPException(status_code=404, detail=f"No builds found for context: {context}")
     else:
-        filtered_builds = all_builds
+        filtered_builds = load_builds().get("builds", [])
+    
+    # Determine default_gear_option_id
+    if profile.game_mode in ["ironman", "hcim", "gim"]:
+        # Iron → progression (no GE assumptions)
+        default_id = "progression"
+    elif setup.effort == "afk":
+        # Effort low (AFK) → budget
+        default_id = "budget"
+    else:
+        # Default → progression
+        default_id = "progression"
     
     # Add default_gear_option_id based on logic and validate synergy rules
     result_builds = []
     for build in filtered_builds:
-        build_copy = build.copy()
-        
-        # Keep original gear from JSON - do NOT auto-construct
-        # Only apply weapon filtering for nmz_melee if needed
-        if build_copy.get("context") == "nmz_melee":
-            requirements = load_item_requirements()
-            skills = profile.skills
-            gear_options = build_copy.get("gear_options", [])
-            weapon_downgraded = False
-            validation_warnings = []
-            
-            for gear_option in gear_options:
-                gear = gear_option.get("gear", [])
-                if not gear:
-                    continue
-                
-                # Store original gear (preserve all items)
-                original_gear = gear.copy()
-                original_length = len(gear)
-                
-                # Filter weapon (only gear[0]) - this preserves all other items
-                filtered_gear, note = filter_weapon_by_requirements(
-                    gear, requirements, skills, profile.membership
-                )
-                
-                # Verify length preserved - if not, keep original
-                if len(filtered_gear) != original_length:
-                    print(f"[BUILDS WARNING] Gear list length mismatch: {original_length} -> {len(filtered_gear)}, keeping original gear")
-                    filtered_gear = original_gear  # Restore original
-                else:
-                    # Update gear option only if length preserved
-                    gear_option["gear"] = filtered_gear
-                    if note:
-                        weapon_downgraded = True
-                
-                # Validate tier rules but don't remove items
-                tier = gear_option.get("id", "")
-                if tier:
-                    is_valid, error_msg = validate_gear_tier(filtered_gear, tier)
-                    if not is_valid:
-                        validation_warnings.append(f"Tier '{tier}': {error_msg}")
-                        print(f"[BUILDS WARNING] Build '{build.get('name', 'Unknown')}' tier '{tier}' validation failed: {error_msg}")
-                        print(f"  Tier rules: {get_tier_description(tier)}")
-                        print(f"  Gear kept as-is: {filtered_gear}")
-            
-            # Add notes if needed
-            if weapon_downgraded or validation_warnings:
-                # Ensure notes list exists
-                if "notes" not in build_copy:
-                    build_copy["notes"] = []
-                existing_notes = set(build_copy.get("notes", []))
-                
-                if weapon_downgraded:
-                    note_text = "Weapon adjusted based on your stats."
-                    if note_text not in existing_notes:
-                        build_copy["notes"].append(note_text)
-                
-                if validation_warnings:
-                    note_text = "Some items may require higher stats or violate tier rules."
-                    if note_text not in existing_notes:
-                        build_copy["notes"].append(note_text)
-        else:
-            # For non-nmz_melee builds, just validate (don't remove items)
-            gear_options = build_copy.get("gear_options", [])
-            for gear_option in gear_options:
-                tier = gear_option.get("id", "")
-                gear = gear_option.get("gear", [])
-                if gear and tier:
-                    is_valid, error_msg = validate_gear_tier(gear, tier)
-                    if not is_valid:
-                        print(f"[BUILDS WARNING] Build '{build.get('name', 'Unknown')}' tier '{tier}' validation failed: {error_msg}")
-                        print(f"  Tier rules: {get_tier_description(tier)}")
-                        print(f"  Gear kept as-is: {gear}")
-        
-        # Determine default_gear_option_id
-        if profile.game_mode in ["ironman", "hcim", "gim"]:
-            # Iron → progression (no GE assumptions)
-            default_id = "progression"
-        elif setup.effort == "afk":
-            # Effort low (AFK) → budget
-            default_id = "budget"
-        else:
-            # Default → progression
-            default_id = "progression"
-        
-        build_copy["default_gear_option_id"] = default_id
-        result_builds.append(BuildCard(**build_copy))
+        card = _STATIC_BUILD_CARDS.get(id(build))
+        if card is None:
+            # Profile-dependent build: reuse the card built for the same weapon eligibility
+            card = _profile_build_card(build, profile)
+        result_builds.append(card.model_copy(update={"default_gear_option_id": default_id}))
     
     return BuildsResponse(builds=result_builds)
 
 
-def load_items_metadata():
-    """Load items acquisition metadata"""
-    items_path = os.path.join(os.path.dirname(__file__), "data", "items_v1.json")
-    try:
-        with open(items_path, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[DETAILS WARNING] Failed to load items metadata: {e}")
-        return {"items": []}
+def load_recipes():
+    """Load recipes data (cached after first load)"""
+    global _RECIPES
+    if _RECIPES is None:
+        try:
+            with open(_RECIPES_PATH, 'rb') as f:
+                _RECIPES = orjson.loads(f.read())
+        except (FileNotFoundError, orjson.JSONDecodeError) as e:
+            logger.warning("Failed to load recipes: %s", e)
+            _RECIPES = {"recipes": []}
+    return _RECIPES
 
 
-def load_recipes():
-    """Load recipes data"""
-    recipes_path = os.path.join(os.path.dirname(__file__), "data", "recipes_v1.json")
-    try:
-        with open(recipes_path, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"[DETAILS WARNING] Failed to load recipes: {e}")
-        return {"recipes": []}
+# Case-insensitive name indexes for /details (first entry with a name wins)
+_ITEMS_BY_NAME_LOWER: Dict[str, Dict] = {}
+for _item in load_items_metadata().get("items", []):
+    _ITEMS_BY_NAME_LOWER.setdefault(_item.get("name", "").lower(), _item)
+
+_RECIPES_BY_NAME_LOWER: Dict[str, Dict] = {}
+for _recipe in load_recipes().get("recipes", []):
+    _RECIPES_BY_NAME_LOWER.setdefault(_recipe.get("name", "").lower(), _recipe)
+
+# Details are static per (type, name) until the data files change (i.e. a deploy),
+# so clients and shared caches may reuse them for a day. The ETag covers only the
+# data (plus _ETAG_VERSION), so it stays valid across restarts and workers.
+_DETAILS_ETAG = _etag(load_items_metadata(), load_recipes())
+_DETAILS_CACHE_CONTROL = "public, max-age=86400, must-revalidate"
+
+
+# Item source type -> (step, source) formatter, called with (source, item_name)
+_ITEM_SOURCE_FORMATTERS = {
+    "Quest": lambda s, name: (
+        f"Complete {s.get('name', '')} quest",
+        f"Quest: {s.get('name', '')}",
+    ),
+    "Drop": lambda s, name: (
+        f"Kill {s.get('name', '')} to obtain {name}",
+        f"Drop: {s.get('name', '')} ({s.get('description', '')})",
+    ),
+    "Shop": lambda s, name: (
+        f"Buy {name} from {s.get('name', '')} in {s.get('location', '')}",
+        f"Shop: {s.get('name', '')} in {s.get('location', '')}",
+    ),
+    "Craft": lambda s, name: (
+        f"Craft {name} (requires {s.get('level', '')} {s.get('skill', '')})",
+        f"Craft: {s.get('level', '')} {s.get('skill', '')}",
+    ),
+    "GE": lambda s, name: (
+        f"Buy {name} from Grand Exchange",
+        "Grand Exchange",
+    ),
+}
+
+# Recipe ingredient source types shown in food details
+_INGREDIENT_SOURCE_TYPES = frozenset({"Fish", "Buy"})
+
+
+def _item_details(item: Dict, name: str) -> Tuple[List[str], List[str]]:
+    """(steps, sources) for an item's acquisition details, worded with the given name"""
+    pairs = [
+        _ITEM_SOURCE_FORMATTERS[source.get("type", "")](source, name)
+        for source in item.get("sources", [])
+        if source.get("type", "") in _ITEM_SOURCE_FORMATTERS
+    ]
+    return [step for step, _ in pairs], [source for _, source in pairs]
+
+
+def _food_details(recipe: Dict) -> Tuple[List[str], List[str]]:
+    """(steps, sources) for a recipe's food details"""
+    # Ingredient acquisition (Fish / Buy sources)
+    ingredient_sources = [
+        source
+        for ingredient in recipe.get("ingredients", [])
+        for source in ingredient.get("sources", [])
+        if source.get("type", "") in _INGREDIENT_SOURCE_TYPES
+    ]
+    steps = [f"{source.get('method', '')}" for source in ingredient_sources]
+    sources = [
+        f"{source.get('type', '')}: {source.get('location', '')} - {source.get('notes', '')}"
+        for source in ingredient_sources
+    ]
+    
+    # Cooking steps
+    cooking_level = recipe.get("cooking_level", 0)
+    cooking_location = recipe.get("cooking_location", "")
+    cooking_method = recipe.get("cooking_method", "")
+    burn_chance = recipe.get("burn_chance", "")
+    nmz_quantity = recipe.get("nmz_quantity", "")
+    
+    steps.append(f"Train Cooking to level {cooking_level}")
+    steps.append(f"{cooking_method}")
+    if burn_chance:
+        steps.append(f"Burn chance: {burn_chance}")
+    if nmz_quantity:
+        steps.append(f"Bring {nmz_quantity} for NMZ training")
+    
+    sources.append(f"Cooking: {cooking_location} (level {cooking_level})")
+    sources.append(f"Healing: {recipe.get('healing', 0)} HP")
+    return steps, sources
+
+
+# Every /details response prebuilt from the static data, keyed by (type,
+# lowercase name) and stored with the name as spelled in the data file, the
+# model, and its encoded body. Titles (and item steps) repeat the requested
+# name, so a request that spells it differently gets a fresh response.
+_DETAILS_CACHE: Dict[Tuple[str, str], Tuple[str, DetailsResponse, bytes]] = {}
+
+
+def _cache_details(type: str, lower_name: str, name: str, details: DetailsResponse):
+    """Store a prebuilt /details response along with its encoded body"""
+    _DETAILS_CACHE[(type, lower_name)] = (name, details, orjson.dumps(details.model_dump()))
+
+
+for _lower_name, _item in _ITEMS_BY_NAME_LOWER.items():
+    _name = _item.get("name", "")
+    _steps, _sources = _item_details(_item, _name)
+    _cache_details("item", _lower_name, _name, DetailsResponse(title=f"{_name} Acquisition", steps=_steps, sources=_sources))
+for _lower_name, _recipe in _RECIPES_BY_NAME_LOWER.items():
+    _name = _recipe.get("name", "")
+    _steps, _sources = _food_details(_recipe)
+    _cache_details("food", _lower_name, _name, DetailsResponse(title=f"{_name} Recipe", steps=_steps, sources=_sources))
 
 
 @app.get("/details", response_model=DetailsResponse)
 async def get_details(
+    request: Request,
     type: str = Query(..., description="Type: 'item' or 'food'"),
     name: str = Query(..., description="Name of the item or food")
 ):
     """Get detailed information about an item or food"""
-    if type == "item":
-        items_data = load_items_metadata()
-        items = items_data.get("items", [])
-        
-        # Find matching item (case-insensitive)
-        item = next((i for i in items if i.get("name", "").lower() == name.lower()), None)
-        
-        if not item:
-            raise HTTPException(status_code=404, detail=f"Item '{name}' not found")
-        
-        # Build steps and sources from item data
-        steps = []
-        sources = []
-        
-        item_sources = item.get("sources", [])
-        for source in item_sources:
-            source_type = source.get("type", "")
-            source_name = source.get("name", "")
-            source_location = source.get("location", "")
-            source_description = source.get("description", "")
-            
-            if source_type == "Quest":
-                steps.append(f"Complete {source_name} quest")
-                sources.append(f"Quest: {source_name}")
-            elif source_type == "Drop":
-                steps.append(f"Kill {source_name} to obtain {name}")
-                sources.append(f"Drop: {source_name} ({source_description})")
-            elif source_type == "Shop":
-                steps.append(f"Buy {name} from {source_name} in {source_location}")
-                sources.append(f"Shop: {source_name} in {source_location}")
-            elif source_type == "Craft":
-                level = source.get("level", "")
-                skill = source.get("skill", "")
-                steps.append(f"Craft {name} (requires {level} {skill})")
-                sources.append(f"Craft: {level} {skill}")
-            elif source_type == "GE":
-                steps.append(f"Buy {name} from Grand Exchange")
-                sources.append("Grand Exchange")
-        
-        return DetailsResponse(
-            title=f"{name} Acquisition",
-            steps=steps,
-            sources=sources
-        )
+    etag = _etag(_DETAILS_ETAG, type, name)
     
+    if type == "item":
+        label = "Item"
     elif type == "food":
-        recipes_data = load_recipes()
-        recipes = recipes_data.get("recipes", [])
-        
-        # Find matching recipe (case-insensitive)
-        recipe = next((r for r in recipes if r.get("name", "").lower() == name.lower()), None)
-        
-        if not recipe:
-            raise HTTPException(status_code=404, detail=f"Food '{name}' not found")
-        
-        # Build steps and sources from recipe data
-        steps = []
-        sources = []
-        
-        # Ingredient acquisition
-        ingredients = recipe.get("ingredients", [])
-        for ingredient in ingredients:
-            ingredient_name = ingredient.get("name", "")
-            ingredient_sources = ingredient.get("sources", [])
-            
-            for source in ingredient_sources:
-                source_type = source.get("type", "")
-                source_location = source.get("location", "")
-                source_method = source.get("method", "")
-                source_notes = source.get("notes", "")
-                
-                if source_type == "Fish":
-                    steps.append(f"{source_method}")
-                    sources.append(f"Fish: {source_location} - {source_notes}")
-                elif source_type == "Buy":
-                    steps.append(f"{source_method}")
-                    sources.append(f"Buy: {source_location} - {source_notes}")
-        
-        # Cooking steps
-        cooking_level = recipe.get("cooking_level", 0)
-        cooking_location = recipe.get("cooking_location", "")
-        cooking_method = recipe.get("cooking_method", "")
-        burn_chance = recipe.get("burn_chance", "")
-        nmz_quantity = recipe.get("nmz_quantity", "")
-        
-        steps.append(f"Train Cooking to level {cooking_level}")
-        steps.append(f"{cooking_method}")
-        if burn_chance:
-            steps.append(f"Burn chance: {burn_chance}")
-        if nmz_quantity:
-            steps.append(f"Bring {nmz_quantity} for NMZ training")
-        
-        sources.append(f"Cooking: {cooking_location} (level {cooking_level})")
-        sources.append(f"Healing: {recipe.get('healing', 0)} HP")
-        
-        return DetailsResponse(
-            title=f"{name} Recipe",
-            steps=steps,
-            sources=sources
-        )
-    
+        label = "Food"
     else:
         raise HTTPException(status_code=400, detail=f"Invalid type '{type}'. Must be 'item' or 'food'")
+    
+    # Find matching item or recipe (case-insensitive)
+    lower_name = name.lower()
+    cached = _DETAILS_CACHE.get((type, lower_name))
+    if cached is None:
+        raise HTTPException(status_code=404, detail=f"{label} '{name}' not found")
+    # 304s repeat Cache-Control so revalidated copies keep their max-age
+    headers = {"ETag": etag, "Cache-Control": _DETAILS_CACHE_CONTROL}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    data_name, details, body = cached
+    if name != data_name:
+        # Titles (and item steps) echo the requested spelling
+        if type == "item":
+            steps, sources = _item_details(_ITEMS_BY_NAME_LOWER[lower_name], name)
+            details = DetailsResponse(title=f"{name} Acquisition", steps=steps, sources=sources)
+        else:
+            details = details.model_copy(update={"title": f"{name} Recipe"})
+        body = orjson.dumps(details.model_dump())
+    
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 # Mount static files at root (after all API routes)
-static_dir = os.path.join(os.path.dirname(__file__), "static")
-if os.path.exists(static_dir):
-    app.mount("/", StaticFiles(directory=static_dir, html=True), name="static")
+_STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+if os.path.exists(_STATIC_DIR):
+    app.mount("/", StaticFiles(directory=_STATIC_DIR, html=True), name="static")
 
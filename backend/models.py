@@ -1,7 +1,28 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Dict, Literal, Optional
 
 
+def calculate_combat_level(skills: dict) -> int:
+    """Calculate combat level using standard OSRS formula"""
+    attack = skills.get("attack", 1)
+    strength = skills.get("strength", 1)
+    defence = skills.get("defence", 1)
+    hitpoints = skills.get("hitpoints", 10)
+    ranged = skills.get("ranged", 1)
+    magic = skills.get("magic", 1)
+    prayer = skills.get("prayer", 1)
+    
+    # floor(x * 1.5) == x * 3 // 2 for integer levels, without float rounding
+    half_prayer = prayer // 2
+    base = 0.25 * (defence + hitpoints + half_prayer)
+    melee = 0.325 * (attack + strength)
+    ranged_cb = 0.325 * (ranged * 3 // 2 + half_prayer)
+    magic_cb = 0.325 * (magic * 3 // 2 + half_prayer)
+    
+    combat = base + max(melee, ranged_cb, magic_cb)
+    return int(combat)
+
+
 class Profile(BaseModel):
     player_name: str = Field(default="", description="RuneScape player name")
     game_mode: Literal["main", "ironman", "hcim", "gim"] = Field(default="main")
@@ -10,8 +31,21 @@ class Profile(BaseModel):
     playtime_minutes: int = Field(default=0, ge=0)
     skills: Dict[str, int] = Field(default_factory=dict)
 
+    @property
+    def total_level(self) -> int:
+        """Sum of all skill levels"""
+        return sum(self.skills.values())
+
+    @property
+    def combat_level(self) -> int:
+        """OSRS combat level"""
+        return calculate_combat_level(self.skills)
+
 
 class AdviceItem(BaseModel):
+    # advisor_engine_v2 memoizes advice and hands the same items to every caller
+    model_config = ConfigDict(frozen=True)
+
     title: str
     why_now: str
     steps: List[str]
@@ -39,6 +73,9 @@ class StrategyResponse(BaseModel):
 
 
 class AlternateSpot(BaseModel):
+    # Spots are prebuilt once in spot_rotation and shared, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     name: str
     reason: str
     requirements: Optional[str] = None
@@ -95,6 +132,9 @@ class BuildCard(BaseModel):
 
 
 class AdviceOption(BaseModel):
+    # Option cards are shared as module-level constants, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     id: str
     title: str
     summary: str = Field(description="1-2 line summary")
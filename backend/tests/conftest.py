@@ -0,0 +1,8 @@
+import os
+import sys
+import tempfile
+
+# Import the backend modules as the app does (from the backend directory),
+# with the database in a throwaway location
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_PATH", os.path.join(tempfile.mkdtemp(), "test.db"))
@@ -0,0 +1,48 @@
+import sqlite3
+
+import orjson
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import database
+
+
+def test_migrates_skills_out_of_json_column(tmp_path, monkeypatch):
+    # A database as written before the skill columns existed
+    path = tmp_path / "old.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE profiles (id INTEGER PRIMARY KEY, player_name VARCHAR, game_mode VARCHAR, "
+        "membership VARCHAR, goals TEXT, playtime_minutes INTEGER, skills TEXT, "
+        "setup_style VARCHAR, setup_priority VARCHAR, setup_effort VARCHAR)"
+    )
+    old_skills = {"attack": 60, "strength": 55, "hitpoints": 58, "sailing": 12}
+    conn.execute(
+        "INSERT INTO profiles VALUES (1, 'Zezima', 'main', 'p2p', '[]', 30, ?, 'melee', '', '')",
+        (orjson.dumps(old_skills).decode(),)
+    )
+    conn.commit()
+    conn.close()
+    
+    engine = create_engine(f"sqlite:///{path}")
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    monkeypatch.setattr(database, "_profile_cache", None)
+    monkeypatch.setattr(database, "_setup_cache", None)
+    
+    database.init_db()
+    profile, setup = database.get_profile_and_setup()
+    assert profile.skills == old_skills
+    assert (profile.player_name, setup.style) == ("Zezima", "melee")
+    
+    # Skills live in their columns; only the custom skill stays in the JSON
+    with engine.connect() as db:
+        attack, skills_json = db.exec_driver_sql("SELECT attack, skills FROM profiles WHERE id = 1").one()
+    assert attack == 60
+    assert orjson.loads(skills_json) == {"sailing": 12}
+    
+    # Saving and reloading round-trips both kinds of skill
+    database.save_profile(profile.model_copy(update={"skills": {**old_skills, "attack": 61}}))
+    monkeypatch.setattr(database, "_profile_cache", None)
+    assert database.get_profile().skills == {**old_skills, "attack": 61}
+    engine.dispose()
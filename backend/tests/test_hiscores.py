@@ -0,0 +1,18 @@
+import asyncio
+
+import hiscores
+
+
+def test_client_is_recreated_after_close():
+    async def lifespan_cycle():
+        client = hiscores._get_client()
+        assert hiscores._get_client() is client
+        await hiscores.close_client()
+        assert client.is_closed
+        
+        # A second lifespan in the same process gets a fresh, open client
+        fresh = hiscores._get_client()
+        assert fresh is not client and not fresh.is_closed
+        await hiscores.close_client()
+    
+    asyncio.run(lifespan_cycle())
@@ -0,0 +1,20 @@
+from models import Profile
+
+
+def test_total_level_tracks_skill_changes():
+    profile = Profile(skills={"attack": 5})
+    assert profile.total_level == 5
+    
+    assert profile.model_copy(update={"skills": {"attack": 50}}).total_level == 50
+    profile.skills = {"attack": 7}
+    assert profile.total_level == 7
+    assert profile == Profile(skills={"attack": 7})
+
+
+def test_combat_level_tracks_skill_changes():
+    profile = Profile(skills={"attack": 99, "strength": 99})
+    assert profile.combat_level == 67
+    
+    copy = profile.model_copy(update={"skills": {}})
+    assert copy.combat_level == 3
+    assert profile == Profile(skills={"attack": 99, "strength": 99})
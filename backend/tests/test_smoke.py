@@ -0,0 +1,78 @@
+import os
+import subprocess
+import sys
+
+from fastapi.testclient import TestClient
+
+import main
+from main import app
+
+
+def test_beginner_path():
+    with TestClient(app) as client:
+        response = client.get("/beginner-path")
+        assert response.status_code == 200
+        assert "cards" in response.json()
+        
+        # Same profile, same ETag -> 304
+        revalidated = client.get("/beginner-path", headers={"If-None-Match": response.headers["ETag"]})
+        assert revalidated.status_code == 304
+
+
+def test_details_etag_is_stable_across_processes():
+    with TestClient(app) as client:
+        response = client.get("/details", params={"type": "item", "name": "Dragon Scimitar"})
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "public, max-age=86400, must-revalidate"
+    
+    # A fresh process (another worker, or after a restart) issues the same ETag
+    other = subprocess.run(
+        [sys.executable, "-c", "import main; print(main._etag(main._DETAILS_ETAG, 'item', 'Dragon Scimitar'))"],
+        capture_output=True, text=True, check=True, cwd=os.path.dirname(main.__file__)
+    )
+    assert other.stdout.strip() == response.headers["ETag"]
+
+
+def test_builds():
+    with TestClient(app) as client:
+        response = client.get("/builds", params={"context": "nmz_melee"})
+        assert response.status_code == 200
+        assert response.headers["Content-Length"]
+        builds = response.json()["builds"]
+        assert builds and all(build["context"] == "nmz_melee" for build in builds)
+        
+        revalidated = client.get(
+            "/builds", params={"context": "nmz_melee"}, headers={"If-None-Match": response.headers["ETag"]}
+        )
+        assert revalidated.status_code == 304
+
+
+def test_details_echoes_requested_spelling():
+    with TestClient(app) as client:
+        exact = client.get("/details", params={"type": "food", "name": "Lobsters"})
+        lower = client.get("/details", params={"type": "food", "name": "lobsters"})
+        assert exact.status_code == lower.status_code == 200
+        assert exact.json()["title"] == "Lobsters Recipe"
+        assert lower.json()["title"] == "lobsters Recipe"
+        assert lower.json()["steps"] == exact.json()["steps"]
+        assert lower.headers["Cache-Control"] == exact.headers["Cache-Control"]
+        
+        revalidated = client.get(
+            "/details", params={"type": "food", "name": "Lobsters"}, headers={"If-None-Match": exact.headers["ETag"]}
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.headers["Cache-Control"] == exact.headers["Cache-Control"]
+        
+        assert client.get("/details", params={"type": "item", "name": "nope"}).status_code == 404
+        assert client.get("/details", params={"type": "bogus", "name": "Lobsters"}).status_code == 400
+
+
+def test_if_none_match_lists_and_weak_tags():
+    with TestClient(app) as client:
+        etag = client.get("/beginner-path").headers["ETag"]
+        assert etag.startswith('W/"')
+        opaque = etag.removeprefix("W/")
+        
+        for header in (etag, opaque, f'"other", {etag}', f'W/"other",{opaque}', "*"):
+            assert client.get("/beginner-path", headers={"If-None-Match": header}).status_code == 304
+        assert client.get("/beginner-path", headers={"If-None-Match": '"other"'}).status_code == 200